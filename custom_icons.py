@@ -5,12 +5,22 @@ ICON_FOLDER = 'icons'
 
 custom_icons = None
 
+# Resolved icon ids by name, cleared whenever the preview collection changes
+_icon_id_cache: dict[str, int | None] = {}
+
+SOCKET_TYPE_TO_ICON = {
+    'COLOR': 'color_socket',
+    'VECTOR': 'vector_socket',
+    'FLOAT': 'float_socket',
+}
+
 def load_icons():
     import bpy.utils.previews
     # Custom Icon
     if not hasattr(bpy.utils, 'previews'):
         return
     global custom_icons
+    _icon_id_cache.clear()
     custom_icons = bpy.utils.previews.new()
 
     folder = os.path.dirname(bpy.path.abspath(
@@ -24,26 +34,27 @@ def load_icons():
 
 def unload_icons():
     global custom_icons
+    _icon_id_cache.clear()
     if hasattr(bpy.utils, 'previews'):
         bpy.utils.previews.remove(custom_icons)
         custom_icons = None
 
 
 def get_icon(custom_icon_name):
+    if custom_icon_name in _icon_id_cache:
+        return _icon_id_cache[custom_icon_name]
     if custom_icons is None:
         return None
     if custom_icon_name not in custom_icons:
-        return None
-    return custom_icons[custom_icon_name].icon_id
+        icon_id = None
+    else:
+        icon_id = custom_icons[custom_icon_name].icon_id
+    _icon_id_cache[custom_icon_name] = icon_id
+    return icon_id
 
     
 def get_icon_from_socket_type(socket_type: str) -> int:
-    type_to_icon = {
-        'COLOR': 'color_socket',
-        'VECTOR': 'vector_socket',
-        'FLOAT': 'float_socket',
-    }
-    return get_icon(type_to_icon.get(socket_type, 'color_socket'))
+    return get_icon(SOCKET_TYPE_TO_ICON.get(socket_type, 'color_socket'))
 
 def get_image_editor_icon(current_image_editor: str) -> int:
         if not current_image_editor:
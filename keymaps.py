@@ -29,7 +29,8 @@ def _add_keymap_entry(
         for prop, prop_value in properties.items():
             try:
                 setattr(kmi.properties, prop, prop_value)
-            except Exception:
+            except (AttributeError, TypeError):
+                # Property missing or typed differently in this Blender version
                 pass
     addon_keymaps.append((km, kmi))
 
@@ -81,7 +82,8 @@ def unregister() -> None:
     for km, kmi in addon_keymaps:
         try:
             km.keymap_items.remove(kmi)
-        except Exception:
+        except (RuntimeError, ReferenceError):
+            # Already removed, or the keymap was freed with its keyconfig
             pass
 
     addon_keymaps.clear()
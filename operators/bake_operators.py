@@ -1,4 +1,6 @@
+import os
 import time
+import textwrap
 import bpy
 from bpy.types import Context, Image, Material, Operator, UILayout
 from bpy.utils import register_classes_factory
@@ -10,6 +12,13 @@ from ..paintsystem.data import Layer, set_layer_blend_type, get_layer_blend_type
 from ..paintsystem.context import parse_material
 from ..panels.common import get_icon_from_channel
 
+# Bake dialog warning, indexed by whether more than one material is enabled
+OTHER_OBJECTS_WARNINGS = (
+    "Detected other objects with the material.",
+    "Detected other objects with the materials.",
+)
+# Tangent normal bake note, wrapped once to the dialog width
+TANGENT_NORMAL_INFO_LINES = textwrap.wrap("Deform Modifiers such as Armature will be disabled", width=48) #50 = maximum length
 
 class BakeOperator(PSContextMixin, PSImageCreateMixin, Operator):
     """Bake the active channel"""
@@ -109,7 +118,7 @@ class BakeOperator(PSContextMixin, PSImageCreateMixin, Operator):
             if objects_not_selected:
                 box.alert = True
                 col = box.column(align=True)
-                col.label(text=f"Detected other objects with the material{'s' if len(enabled_materials) > 1 else ''}.", icon='ERROR')
+                col.label(text=OTHER_OBJECTS_WARNINGS[len(enabled_materials) > 1], icon='ERROR')
                 col.label(text="They will not be baked", icon='BLANK1')
                 box.alert = False
                 box.operator(PAINTSYSTEM_OT_SelectAllBakedObjects.bl_idname, text="Select All Objects", icon='SELECT_EXTEND')
@@ -154,12 +163,9 @@ class BakeOperator(PSContextMixin, PSImageCreateMixin, Operator):
             box = layout.box()
             box.prop(self, "as_tangent_normal")
             if self.as_tangent_normal:
-                import textwrap
-                wrapp = textwrap.TextWrapper(width=48) #50 = maximum length
                 info_box = box.box()
                 col = info_box.column(align=True)
-                wList = wrapp.wrap(text="Deform Modifiers such as Armature will be disabled")
-                for i, chunk in enumerate(wList):
+                for i, chunk in enumerate(TANGENT_NORMAL_INFO_LINES):
                     col.label(text=chunk, icon='INFO' if not i else 'BLANK1')
 
 
@@ -446,8 +452,6 @@ class PAINTSYSTEM_OT_ExportAllImages(PSContextMixin, Operator):
         box.prop(self, "replace_whitespaces")
     
     def execute(self, context):
-        import os
-        
         ps_ctx = self.parse_context(context)
         active_group = ps_ctx.active_group
         
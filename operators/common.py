@@ -1,6 +1,6 @@
 import bpy
 from bpy.props import IntProperty
-from ..paintsystem.data import COORDINATE_TYPE_ENUM, create_ps_image, get_udim_tiles
+from ..paintsystem.data import COORDINATE_TYPE_ENUM, create_ps_image, get_udim_tiles, get_udim_tiles_cached
 from ..paintsystem.context import PSContextMixin
 from ..custom_icons import get_icon, get_icon_from_socket_type
 from ..preferences import get_preferences
@@ -258,7 +258,7 @@ class PSImageCreateMixin(PSUVOptionsMixin):
             col.prop(self, "image_height", text="Height")
         if self.coord_type == 'UV':
             ps_ctx = PSContextMixin.parse_context(context)
-            udim_tiles = get_udim_tiles(ps_ctx.ps_object, self.uv_map_name)
+            udim_tiles = get_udim_tiles_cached(ps_ctx.ps_object, self.uv_map_name)
             use_udim_tiles = udim_tiles != {1001}
             if udim_tiles and use_udim_tiles:
                 box.prop(self, "use_udim_tiles")
@@ -283,7 +283,8 @@ class PSImageCreateMixin(PSUVOptionsMixin):
         ps_ctx = PSContextMixin.parse_context(context)
         if ps_ctx.ps_object.mode == 'EDIT':
             bpy.ops.object.mode_set(mode="OBJECT")
-        self.use_udim_tiles = get_udim_tiles(ps_ctx.ps_object, self.uv_map_name) != {1001}
+        # Warms the cache image_create_ui reads when the dialog draws
+        self.use_udim_tiles = get_udim_tiles_cached(ps_ctx.ps_object, self.uv_map_name) != {1001}
 
 
 class PSImageFilterMixin:
@@ -324,18 +325,23 @@ class PSImageFilterMixin:
 def wait_for_redraw() -> None:
     bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
 
+# Resolved bpy.ops callables, keyed by dotted operator ID
+_operator_func_cache = {}
+
 def run_operator_by_id(operator_id, **kwargs):
     """
     Calls a Blender operator using its dotted string ID.
     Example: run_operator_by_id("mesh.primitive_cube_add", size=2)
     """
     try:
-        # Split 'mesh.primitive_cube_add' into 'mesh' and 'primitive_cube_add'
-        category, name = operator_id.split(".")
-        
-        # dynamic access: bpy.ops -> category -> name
-        op_category = getattr(bpy.ops, category)
-        op_func = getattr(op_category, name)
+        op_func = _operator_func_cache.get(operator_id)
+        if op_func is None:
+            # Split 'mesh.primitive_cube_add' into 'mesh' and 'primitive_cube_add'
+            category, name = operator_id.split(".")
+            
+            # dynamic access: bpy.ops -> category -> name
+            op_category = getattr(bpy.ops, category)
+            op_func = _operator_func_cache[operator_id] = getattr(op_category, name)
         
         # Call the operator with any arguments provided
         return op_func(**kwargs)
@@ -19,6 +19,7 @@ from ..paintsystem.data import (
     get_layer_by_uid,
 )
 from ..paintsystem.image import save_image
+from ..panels.common import get_wrapped_warning
 from ..utils import get_next_unique_name
 from ..utils.nodes import get_nodetree_socket_enum
 from .common import (
@@ -1036,10 +1037,7 @@ class PAINTSYSTEM_OT_ShowLayerWarnings(PSContextMixin, Operator):
         warnings_box = layout.box()
         warnings_col = warnings_box.column(align=True)
         for warning in warnings:
-            # Split warning into chunks of 6 words
-            words = warning.split()
-            chunks = [' '.join(words[j:j+6]) for j in range(0, len(words), 6)]
-            for i, chunk in enumerate(chunks):
+            for i, chunk in enumerate(get_wrapped_warning(warning)):
                 warnings_col.label(text=chunk, icon='ERROR' if not i else 'BLANK1')
     
     def execute(self, context):
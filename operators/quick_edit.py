@@ -35,8 +35,6 @@ class PAINTSYSTEM_OT_ProjectEdit(PSContextMixin, Operator):
     bl_options = {'REGISTER'}
 
     def execute(self, context):
-        import os
-
         ps_ctx = self.parse_context(context)
         active_layer = ps_ctx.active_layer
         if not active_layer.image:
@@ -12,6 +12,9 @@ from ..utils.version import is_newer_than
 if TYPE_CHECKING:
     from .data import MaterialData, Group, Channel, Layer, GlobalLayer, PaintSystemGlobalData
 
+# Grease pencil objects are only supported from Blender 4.3 on
+SUPPORTS_GREASE_PENCIL = is_newer_than(4, 3, 0)
+
 @dataclass
 class PSContext:
     ps_settings: "PaintSystemPreferences" | None = None
@@ -39,12 +42,12 @@ def get_ps_object(obj) -> bpy.types.Object | None:
         return None
     match obj.type:
         case 'EMPTY':
-            if obj.parent and obj.parent.type == 'MESH' and hasattr(obj.parent.active_material, 'ps_mat_data'):
+            if obj.parent and obj.parent.type == 'MESH' and obj.parent.active_material is not None:
                 return obj.parent
         case 'MESH':
             return obj
         case 'GREASEPENCIL':
-            if is_newer_than(4, 3, 0):
+            if SUPPORTS_GREASE_PENCIL:
                 return obj
     return None
 
@@ -55,7 +58,7 @@ def parse_material(mat: Material) -> tuple["MaterialData", "Group", "Channel", "
     active_channel = None
     unlinked_layer = None
 
-    if mat and hasattr(mat, 'ps_mat_data') and mat.ps_mat_data:
+    if mat and mat.ps_mat_data:
         mat_data = mat.ps_mat_data
         groups = mat_data.groups
         if groups and mat_data.active_index >= 0:
@@ -74,7 +77,15 @@ def parse_material(mat: Material) -> tuple["MaterialData", "Group", "Channel", "
     return mat_data, active_group, active_channel, unlinked_layer
 
 def parse_context(context: bpy.types.Context) -> PSContext:
-    """Parse the context and return a PSContext object."""
+    """Parse the context and return a PSContext object.
+
+    Anything parsing the context outside of drawing may be about to change
+    the data it points at, so this also drops the cached UI contexts.
+    """
+    _ui_context_cache.clear()
+    return _parse_context(context)
+
+def _parse_context(context: bpy.types.Context) -> PSContext:
     if not context:
         raise ValueError("Context cannot be None")
     if not isinstance(context, bpy.types.Context):
@@ -109,10 +120,57 @@ def parse_context(context: bpy.types.Context) -> PSContext:
         active_global_layer=get_legacy_global_layer(unlinked_layer) if unlinked_layer else None
     )
 
+# Per-redraw cache of parse_context results for UI classes, keyed by scene,
+# active object pointer and active material slot. Panels, menus and lists each
+# parse the context in poll and draw, so one redraw would otherwise parse it
+# dozens of times. The cached PSContext holds raw RNA pointers into layer
+# collections, so it is dropped by any uncached parse_context (operators and
+# update callbacks), before and after depsgraph updates, on undo/redo/load,
+# and by a zero-interval timer after the redraw.
+_ui_context_cache: dict[tuple[int, int, int], PSContext] = {}
+
+UI_CONTEXT_CLASSES = (bpy.types.Panel, bpy.types.Menu, bpy.types.UIList)
+
+def clear_ui_context_cache():
+    """Forget all cached UI parse_context results."""
+    _ui_context_cache.clear()
+
+def _clear_ui_context_cache_timer():
+    # Timers run with the notifiers, after the next round of event handling,
+    # so this only bounds the cache lifetime. Operators clear it themselves
+    # through parse_context before touching any data.
+    _ui_context_cache.clear()
+    return None
+
+def parse_ui_context(context: bpy.types.Context) -> PSContext:
+    """parse_context, cached for the rest of the current redraw.
+
+    Draw and poll code must use this (or a PSContext passed down from its
+    caller) and never the free parse_context, which clears the cache.
+    """
+    obj = context.active_object if hasattr(context, 'active_object') else None
+    if obj:
+        cache_key = (context.scene.as_pointer(), obj.as_pointer(), obj.active_material_index)
+    else:
+        cache_key = (context.scene.as_pointer(), 0, 0)
+    ps_ctx = _ui_context_cache.get(cache_key)
+    if ps_ctx is None:
+        ps_ctx = _parse_context(context)
+        if not _ui_context_cache and not bpy.app.timers.is_registered(_clear_ui_context_cache_timer):
+            bpy.app.timers.register(_clear_ui_context_cache_timer, first_interval=0)
+        _ui_context_cache[cache_key] = ps_ctx
+    return ps_ctx
+
 class PSContextMixin:
     """A mixin for classes that need access to the paint system context."""
 
-    @staticmethod
-    def parse_context(context: bpy.types.Context) -> PSContext:
-        """Return a PSContext parsed from Blender context. Safe to call from class or instance methods."""
+    @classmethod
+    def parse_context(cls, context: bpy.types.Context) -> PSContext:
+        """Return a PSContext parsed from Blender context. Safe to call from class or instance methods.
+
+        Panels, menus and lists share one parse per redraw; everything else,
+        operators included, always parses fresh.
+        """
+        if issubclass(cls, UI_CONTEXT_CLASSES):
+            return parse_ui_context(context)
         return parse_context(context)
\ No newline at end of file
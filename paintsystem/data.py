@@ -43,11 +43,11 @@ from .list_manager import ListManager
 
 # ---
 from ..custom_icons import get_icon
-from ..utils.version import is_newer_than
+from ..utils.version import is_newer_than, HAS_TOOL_SETTINGS_UNIFIED_PAINT
 from ..utils.nodes import find_node, find_socket_on_node, get_material_output, get_node_socket_enum, get_nodetree_socket_enum, transfer_connection
 from ..preferences import get_preferences
 from ..utils import get_next_unique_name
-from .context import get_legacy_global_layer, parse_context
+from .context import PSContext, get_legacy_global_layer, parse_context
 from .graph import (
     NodeTreeBuilder,
     Add_Node,
@@ -67,6 +67,9 @@ for blend_mode in bpy.types.ShaderNodeMixRGB.bl_rna.properties['blend_type'].enu
             BLEND_MODE_ENUM.append(("PASSTHROUGH", "Pass Through", "Pass Through"))
         BLEND_MODE_ENUM.append(None)
 
+# Blend modes for non-folder layers, built once for the dynamic items callback
+LAYER_BLEND_MODE_ENUM = [blend_mode for blend_mode in BLEND_MODE_ENUM if blend_mode is None or blend_mode[0] != "PASSTHROUGH"]
+
 MASK_BLEND_MODE_ENUM = [
     ('SUBTRACT', "Subtract", "Subtract"),
     ('ADD', "Add", "Add"),
@@ -514,6 +517,31 @@ def get_udim_tiles(object: bpy.types.Object, uv_layer_name: str):
     tile_numbers = 1000 + rows * 10 + cols
     return set(tile_numbers.tolist())
 
+# Module-level cache for get_udim_tiles_cached, keyed by mesh pointer and UV
+# layer name: {(pointer, uv_layer_name): (loop count, tile numbers)}
+_udim_tiles_cache: Dict[tuple[int, str], tuple[int, frozenset]] = {}
+
+def invalidate_udim_tiles_cache():
+    """Forget all cached get_udim_tiles_cached results."""
+    _udim_tiles_cache.clear()
+
+def get_udim_tiles_cached(object: bpy.types.Object, uv_layer_name: str) -> frozenset:
+    """Cached get_udim_tiles for draw code.
+
+    Operator dialogs redraw constantly, so the UV scan is only repeated when
+    the loop count changes or invalidate_udim_tiles_cache runs.
+    """
+    mesh = object.data
+    uv_layer = mesh.uv_layers.get(uv_layer_name)
+    loop_count = len(uv_layer.uv) if uv_layer else 0
+    cache_key = (mesh.as_pointer(), uv_layer_name)
+    cached = _udim_tiles_cache.get(cache_key)
+    if cached is not None and cached[0] == loop_count:
+        return cached[1]
+    udim_tiles = frozenset(get_udim_tiles(object, uv_layer_name))
+    _udim_tiles_cache[cache_key] = (loop_count, udim_tiles)
+    return udim_tiles
+
 def ensure_udim_tiles(image: bpy.types.Image, objects: list[bpy.types.Object], uv_layer_name: str):
     # Check position the data in uv_layer, create a list of number for UDIM tiles
     udim_tiles = set()
@@ -526,8 +554,9 @@ def ensure_udim_tiles(image: bpy.types.Image, objects: list[bpy.types.Object], u
         if tile.channels == 0:
             image.tiles.remove(tile)
 
+    existing_tiles = {tile.number for tile in image.tiles}
     for tile_number in udim_tiles:
-        if any(tile_number == tile.number for tile in image.tiles):
+        if tile_number in existing_tiles:
             continue
         with bpy.context.temp_override(edit_image=image):
             bpy.ops.image.tile_add(number=tile_number, color=(0, 0, 0, 0), width=width, height=height)
@@ -745,6 +774,7 @@ class GlobalLayer(PropertyGroup):
         name="Expanded",
         description="Expand the layer",
         default=True,
+        options=set()
     )
     is_clip: BoolProperty(
         name="Clip",
@@ -1261,6 +1291,7 @@ class Layer(BaseNestedListItem):
         name="Expanded",
         description="Expand the layer",
         default=True,
+        options=set()
         # update=select_layer
     )
     def update_is_clip(self, context: Context):
@@ -1359,7 +1390,7 @@ class Layer(BaseNestedListItem):
         for channel in find_channels_containing_layer(layer_data):
             channel.update_node_tree(context)
     def get_blend_mode_items(self, context: Context) -> list[tuple[str, str, str]]:
-        return BLEND_MODE_ENUM if self.type == "FOLDER" else [blend_mode for blend_mode in BLEND_MODE_ENUM if blend_mode is None or blend_mode[0] != "PASSTHROUGH"]
+        return BLEND_MODE_ENUM if self.type == "FOLDER" else LAYER_BLEND_MODE_ENUM
     blend_mode: EnumProperty(
         items=get_blend_mode_items,
         name="Blend Mode",
@@ -1436,8 +1467,9 @@ class Layer(BaseNestedListItem):
     def uses_coord_type(self) -> bool:
         return self.type in ['IMAGE', 'TEXTURE']
     
-    def get_layer_warnings(self, context: Context) -> List[str]:
-        ps_ctx = parse_context(context)
+    def get_layer_warnings(self, context: Context, ps_ctx: PSContext | None = None) -> List[str]:
+        if ps_ctx is None:
+            ps_ctx = parse_context(context)
         layer_data = self.get_layer_data()
         active_channel = ps_ctx.active_channel
         flattened = active_channel.flatten_hierarchy()
@@ -1605,6 +1637,26 @@ class Layer(BaseNestedListItem):
     def modifies_color_data(self) -> bool:
         return self.type == "ATTRIBUTE" or (self.type == "GRADIENT" and self.gradient_type == "GRADIENT_MAP") or self.blend_mode != "MIX"
 
+# Module-level cache of Layer.get_layer_warnings results, keyed by layer pointer.
+# Cleared on every depsgraph update, see handlers.layer_warnings_cache_handler.
+_layer_warnings_cache: Dict[int, List[str]] = {}
+
+def get_cached_layer_warnings(layer: "Layer", context: Context, ps_ctx: PSContext) -> List[str]:
+    """Return layer.get_layer_warnings(context), reusing results between redraws.
+
+    Called while drawing, so it takes the caller's PSContext instead of
+    parsing one, which would drop the cached UI contexts.
+    """
+    cache_key = layer.as_pointer()
+    warnings = _layer_warnings_cache.get(cache_key)
+    if warnings is None:
+        warnings = _layer_warnings_cache[cache_key] = layer.get_layer_warnings(context, ps_ctx)
+    return warnings
+
+def invalidate_layer_warnings_cache():
+    """Forget all cached layer warnings."""
+    _layer_warnings_cache.clear()
+
 def get_layer_by_uid(material: Material, uid: str) -> Layer | None:
     uid_to_layer = _get_material_layer_uid_map(material)
     layer = uid_to_layer.get(uid)
@@ -2793,10 +2845,11 @@ class PaintSystemGlobalData(PropertyGroup):
     """
     
     def get_brush_color(self, context):
-        settings = context.tool_settings.image_paint
+        tool_settings = context.tool_settings
+        settings = tool_settings.image_paint
         brush = settings.brush
-        if hasattr(context.tool_settings, "unified_paint_settings"):
-            ups = context.tool_settings.unified_paint_settings
+        if HAS_TOOL_SETTINGS_UNIFIED_PAINT:
+            ups = tool_settings.unified_paint_settings
         else:
             ups = settings.unified_paint_settings
         prop_owner = ups if ups.use_unified_color else brush
@@ -2819,25 +2872,28 @@ class PaintSystemGlobalData(PropertyGroup):
     def update_hsv_color(self, context):
         if context.mode != 'PAINT_TEXTURE':
             return
-        settings = context.tool_settings.image_paint
+        tool_settings = context.tool_settings
+        settings = tool_settings.image_paint
         brush = settings.brush
-        if hasattr(context.tool_settings, "unified_paint_settings"):
-            ups = context.tool_settings.unified_paint_settings
+        if HAS_TOOL_SETTINGS_UNIFIED_PAINT:
+            ups = tool_settings.unified_paint_settings
         else:
             ups = settings.unified_paint_settings
         ubs = ups if ups.use_unified_color else brush
         # Store color to context.ps_scene_data.hsv_color
-        hsv = ubs.color.hsv
-        if hsv != (context.scene.ps_scene_data.hue, context.scene.ps_scene_data.saturation, context.scene.ps_scene_data.value):
-            context.scene.ps_scene_data.hue = hsv[0]
-            context.scene.ps_scene_data.saturation = hsv[1]
-            context.scene.ps_scene_data.value = hsv[2]
+        ps_scene_data = context.scene.ps_scene_data
+        hsv = tuple(ubs.color.hsv)
+        if hsv != (ps_scene_data.hue, ps_scene_data.saturation, ps_scene_data.value):
+            ps_scene_data.hue = hsv[0]
+            ps_scene_data.saturation = hsv[1]
+            ps_scene_data.value = hsv[2]
             color = ubs.color
             r = int(color[0] * 255)
             g = int(color[1] * 255)
             b = int(color[2] * 255)
             hex_color = "#{:02x}{:02x}{:02x}".format(r, g, b).upper()
-            context.scene.ps_scene_data.hex_color = hex_color
+            if ps_scene_data.hex_color != hex_color:
+                ps_scene_data.hex_color = hex_color
     
     clipboard_layers: CollectionProperty(
         type=ClipboardLayer,
@@ -3179,6 +3235,19 @@ class LegacyPaintSystemGroups(PropertyGroup):
         default=True
     )
 
+def get_legacy_material_settings(obj: Optional[bpy.types.Object]):
+    """Legacy paint_system settings of *obj*'s active material, if any.
+
+    Panels only need this to detect legacy data, so it skips the node
+    lookups a full LegacyPaintSystemContextParser does on construction.
+    """
+    if not obj or obj.type != 'MESH':
+        return None
+    mat = obj.active_material
+    if not mat or not hasattr(mat, "paint_system"):
+        return None
+    return mat.paint_system
+
 class LegacyPaintSystemContextParser:
     def __init__(self, context: bpy.types.Context):
         self.context = context
@@ -3199,10 +3268,7 @@ class LegacyPaintSystemContextParser:
         return self.active_object.active_material
 
     def get_material_settings(self):
-        mat = self.get_active_material()
-        if not mat or not hasattr(mat, "paint_system"):
-            return None
-        return mat.paint_system
+        return get_legacy_material_settings(self.active_object)
 
     def get_groups(self) -> Optional[PropertyGroup]:
         paint_system = self.get_material_settings()
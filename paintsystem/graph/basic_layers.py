@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 
 import bpy
-from .common import create_mixing_graph, NodeTreeBuilder, create_coord_graph, get_library_nodetree, get_layer_blend_type, set_layer_blend_type, DEFAULT_PS_UV_MAP_NAME
+from .common import create_mixing_graph, NodeTreeBuilder, create_coord_graph, get_library_nodetree, get_layer_blend_type, set_layer_blend_type, DEFAULT_PS_UV_MAP_NAME, TEX_COORD_OUTPUT_TYPES, NORMAL_GEOMETRY_TYPES
 
 if TYPE_CHECKING:
     from ..data import Layer
@@ -153,7 +153,7 @@ class PSNodeTreeBuilder:
             self._builder.add_node("uvmap", "ShaderNodeUVMap", {"uv_map": uv_map_name}, force_properties=True)
             output_node_name, output_socket_name = self._create_mapping_setup("uvmap", "UV")
             self._builder.link(output_node_name, node_name, output_socket_name, socket_name)
-        elif coord_type in ["OBJECT", "CAMERA", "WINDOW", "REFLECTION", "GENERATED"]:
+        elif coord_type in TEX_COORD_OUTPUT_TYPES:
             empty_object = self._layer.empty_object
             self._builder.add_node("tex_coord", "ShaderNodeTexCoord", {"object": empty_object})
             output_node_name, output_socket_name = self._create_mapping_setup("tex_coord", coord_type.title())
@@ -595,7 +595,8 @@ def create_geometry_graph(layer: "Layer"):
     normalize_normals = layer.normalize_normal
     geometry_type = layer.geometry_type
     # Determine which node and socket to use for mixing graph
-    if geometry_type in ['WORLD_NORMAL', 'WORLD_TRUE_NORMAL', 'OBJECT_NORMAL'] and normalize_normals:
+    use_normalize = normalize_normals and geometry_type in NORMAL_GEOMETRY_TYPES
+    if use_normalize:
         color_node_name = "normalize"
         color_socket = "Vector"
     else:
@@ -604,7 +605,7 @@ def create_geometry_graph(layer: "Layer"):
     builder = PSNodeTreeBuilder(layer, GEOMETRY_LAYER_VERSION, color_node_name, color_socket)
     if geometry_type == 'VECTOR_TRANSFORM':
         builder.link("group_input", "geometry", "Color", "Vector")
-    elif geometry_type in ['WORLD_NORMAL', 'WORLD_TRUE_NORMAL', 'OBJECT_NORMAL'] and normalize_normals:
+    elif use_normalize:
         builder.add_node("normalize", "ShaderNodeVectorMath", {"operation": "MULTIPLY_ADD", "hide": True}, {1: (0.5, 0.5, 0.5), 2: (0.5, 0.5, 0.5)})
         builder.link("geometry", "normalize", output_name_map[geometry_type], "Vector")
     elif geometry_type == 'AMBIENT_OCCLUSION':
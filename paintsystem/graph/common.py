@@ -13,6 +13,10 @@ import re
 
 LIBRARY_FILENAME = "library2.blend"
 DEFAULT_PS_UV_MAP_NAME = "PS_UVMap"
+# Coordinate types taken straight from a Texture Coordinate node output
+TEX_COORD_OUTPUT_TYPES = frozenset({"OBJECT", "CAMERA", "WINDOW", "REFLECTION", "GENERATED"})
+# Geometry outputs that get remapped to 0-1 colors when normalize_normal is on
+NORMAL_GEOMETRY_TYPES = frozenset({"WORLD_NORMAL", "WORLD_TRUE_NORMAL", "OBJECT_NORMAL"})
 
 LIBRARY_NODE_TREE_VERSIONS = {
     ".PS Projection": 1,
@@ -153,7 +157,7 @@ def create_coord_graph(builder: NodeTreeBuilder, layer: "Layer", coord_type: str
         builder.add_node("uvmap", "ShaderNodeUVMap", {"uv_map": uv_map_name}, force_properties=True)
         builder.link("uvmap", "mapping", "UV", "Vector")
         builder.link("mapping", node_name, "Vector", socket_name)
-    elif coord_type in ["OBJECT", "CAMERA", "WINDOW", "REFLECTION", "GENERATED"]:
+    elif coord_type in TEX_COORD_OUTPUT_TYPES:
         empty_object = layer.empty_object
         builder.add_node("tex_coord", "ShaderNodeTexCoord", {"object": empty_object})
         builder.link("tex_coord", "mapping", coord_type.title(), "Vector")
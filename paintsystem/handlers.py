@@ -1,8 +1,8 @@
 import bpy
 
 from .versioning import get_layer_parent_map, migrate_global_layer_data, migrate_blend_mode, migrate_source_node, migrate_socket_names, update_layer_name, update_layer_version, update_library_nodetree_version
-from .context import parse_context
-from .data import sort_actions, get_all_layers, is_valid_uuidv4, iter_all_layers
+from .context import parse_context, clear_ui_context_cache
+from .data import sort_actions, get_all_layers, is_valid_uuidv4, iter_all_layers, invalidate_layer_warnings_cache, invalidate_udim_tiles_cache
 from .image import save_image
 from .graph.basic_layers import get_layer_version_for_type
 import time
@@ -14,6 +14,9 @@ logger = get_logger(__name__)
 
 _COLOR_HISTORY_PALETTE_NAME = "Paint System History"
 
+# ID types whose updates can change the warnings shown for a layer
+LAYER_WARNING_ID_TYPES = ('MATERIAL', 'NODETREE', 'SCENE')
+
 
 def get_ps_scene_data(scene: bpy.types.Scene):
     if not hasattr(scene, 'ps_scene_data'):
@@ -184,6 +187,59 @@ def color_history_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph
         logger.error(f"Color History Error: {e}")
         pass
 
+@bpy.app.handlers.persistent
+def image_painted_cache_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph = None):
+    """Drop cached is_image_painted results and UDIM labels for images that changed."""
+    from ..panels.common import invalidate_image_painted_cache, invalidate_prewarmed_channels, invalidate_udim_tiles_label_cache
+    if depsgraph is None:
+        invalidate_image_painted_cache()
+        invalidate_prewarmed_channels()
+        invalidate_udim_tiles_label_cache()
+        return
+    if not depsgraph.id_type_updated('IMAGE'):
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Image):
+            invalidate_image_painted_cache(update.id.original)
+            invalidate_udim_tiles_label_cache(update.id.original)
+
+@bpy.app.handlers.persistent
+def group_multiuser_cache_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph = None):
+    """Drop cached check_group_multiuser results when materials or node trees change."""
+    from ..panels.common import invalidate_group_multiuser_cache
+    if depsgraph and not (depsgraph.id_type_updated('MATERIAL') or depsgraph.id_type_updated('NODETREE')):
+        return
+    invalidate_group_multiuser_cache()
+
+@bpy.app.handlers.persistent
+def layer_warnings_cache_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph = None):
+    """Drop cached layer warnings when the data they are derived from changes.
+
+    Paint strokes and object transforms only update images and objects, so
+    the warnings snapshot survives them.
+    """
+    if depsgraph and not any(depsgraph.id_type_updated(id_type) for id_type in LAYER_WARNING_ID_TYPES):
+        return
+    invalidate_layer_warnings_cache()
+
+@bpy.app.handlers.persistent
+def udim_tiles_cache_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph = None):
+    """Drop cached UDIM tile sets when mesh data changes."""
+    if depsgraph and not depsgraph.id_type_updated('MESH'):
+        return
+    invalidate_udim_tiles_cache()
+
+@bpy.app.handlers.persistent
+def ps_brushes_cache_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph = None):
+    """Drop the cached preset brush check when another file is loaded."""
+    from ..panels.extras_panels import invalidate_ps_brushes_cache
+    invalidate_ps_brushes_cache()
+
+@bpy.app.handlers.persistent
+def ui_context_cache_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph = None):
+    """Drop cached UI contexts around scene changes, undo and file loads."""
+    clear_ui_context_cache()
+
 @bpy.app.handlers.persistent
 def paint_system_object_update(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph = None):
     """Handle object changes and update paint canvas"""
@@ -244,6 +300,24 @@ def register():
     bpy.app.handlers.load_post.append(refresh_image)
     bpy.app.handlers.depsgraph_update_post.append(paint_system_object_update)
     bpy.app.handlers.depsgraph_update_post.append(color_history_handler)
+    bpy.app.handlers.depsgraph_update_post.append(image_painted_cache_handler)
+    bpy.app.handlers.load_post.append(image_painted_cache_handler)
+    bpy.app.handlers.undo_post.append(image_painted_cache_handler)
+    bpy.app.handlers.redo_post.append(image_painted_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.append(group_multiuser_cache_handler)
+    bpy.app.handlers.load_post.append(group_multiuser_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.append(layer_warnings_cache_handler)
+    bpy.app.handlers.load_post.append(layer_warnings_cache_handler)
+    bpy.app.handlers.undo_post.append(layer_warnings_cache_handler)
+    bpy.app.handlers.redo_post.append(layer_warnings_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.append(udim_tiles_cache_handler)
+    bpy.app.handlers.load_post.append(udim_tiles_cache_handler)
+    bpy.app.handlers.load_post.append(ps_brushes_cache_handler)
+    bpy.app.handlers.depsgraph_update_pre.append(ui_context_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.append(ui_context_cache_handler)
+    bpy.app.handlers.load_post.append(ui_context_cache_handler)
+    bpy.app.handlers.undo_post.append(ui_context_cache_handler)
+    bpy.app.handlers.redo_post.append(ui_context_cache_handler)
     bpy.app.timers.register(on_addon_enable, first_interval=0.1)
     bpy.msgbus.subscribe_rna(
         key=(bpy.types.UnifiedPaintSettings, "color"),
@@ -271,4 +345,23 @@ def unregister():
     bpy.app.handlers.save_pre.remove(save_handler)
     bpy.app.handlers.load_post.remove(refresh_image)
     bpy.app.handlers.depsgraph_update_post.remove(paint_system_object_update)
-    bpy.app.handlers.depsgraph_update_post.remove(color_history_handler)
\ No newline at end of file
+    bpy.app.handlers.depsgraph_update_post.remove(color_history_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(image_painted_cache_handler)
+    bpy.app.handlers.load_post.remove(image_painted_cache_handler)
+    bpy.app.handlers.undo_post.remove(image_painted_cache_handler)
+    bpy.app.handlers.redo_post.remove(image_painted_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(group_multiuser_cache_handler)
+    bpy.app.handlers.load_post.remove(group_multiuser_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(layer_warnings_cache_handler)
+    bpy.app.handlers.load_post.remove(layer_warnings_cache_handler)
+    bpy.app.handlers.undo_post.remove(layer_warnings_cache_handler)
+    bpy.app.handlers.redo_post.remove(layer_warnings_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(udim_tiles_cache_handler)
+    bpy.app.handlers.load_post.remove(udim_tiles_cache_handler)
+    bpy.app.handlers.load_post.remove(ps_brushes_cache_handler)
+    bpy.app.handlers.depsgraph_update_pre.remove(ui_context_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(ui_context_cache_handler)
+    bpy.app.handlers.load_post.remove(ui_context_cache_handler)
+    bpy.app.handlers.undo_post.remove(ui_context_cache_handler)
+    bpy.app.handlers.redo_post.remove(ui_context_cache_handler)
+    clear_ui_context_cache()
\ No newline at end of file
@@ -74,11 +74,15 @@ class ListManager:
     def possible_moves(self):
         """Determine possible moves for the active item ('UP', 'DOWN')."""
         moves = []
-        if not self.collection or self.active_index < 0:
+        # Resolve the collection and index once; both are RNA lookups and this
+        # runs from operator polls on every redraw
+        collection = self.collection
+        active_index = self.active_index
+        if not collection or active_index < 0:
             return moves
 
-        if self.active_index > 0:
+        if active_index > 0:
             moves.append('UP')
-        if self.active_index < len(self.collection) - 1:
+        if active_index < len(collection) - 1:
             moves.append('DOWN')
         return moves
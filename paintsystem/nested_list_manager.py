@@ -1,8 +1,15 @@
 from typing import Literal
 import bpy
+import numpy as np
 from bpy.props import StringProperty, IntProperty, EnumProperty
 from bpy.types import PropertyGroup
 
+# Module-level cache for flatten_hierarchy, keyed by manager pointer:
+# {pointer: (structure signature, [(collection index, level), ...])}
+# Only plain ints are stored, so entries stay safe across undo.
+_flatten_cache: dict[int, tuple[bytes, list[tuple[int, int]]]] = {}
+
+
 class BaseNestedListItem(PropertyGroup):
     """Base class for nested list items. Extend this class to add custom properties."""
     id: IntProperty()
@@ -173,20 +180,55 @@ class BaseNestedListManager(PropertyGroup):
             return flattened[flattened_index].id
         return -1
 
+    def get_structure_signature(self) -> bytes:
+        """Return the ids, parent ids and orders of all items as one bytes blob.
+
+        Read with foreach_get, so detecting a changed hierarchy costs three
+        bulk copies instead of a Python loop over the collection.
+        """
+        collection = getattr(self, self.collection_name)
+        count = len(collection)
+        values = np.empty(count * 3, dtype=np.int32)
+        collection.foreach_get("id", values[:count])
+        collection.foreach_get("parent_id", values[count:count * 2])
+        collection.foreach_get("order", values[count * 2:])
+        return values.tobytes()
+
     def flatten_hierarchy(self):
-        """Return a list of (item, level) tuples representing the hierarchy in display order."""
+        """Return a list of (item, level) tuples representing the hierarchy in display order.
+
+        The display order is cached and only rebuilt when the structure
+        signature of the collection changes.
+        """
+        collection = getattr(self, self.collection_name)
+        signature = self.get_structure_signature()
+        cache_key = self.as_pointer()
+        cached = _flatten_cache.get(cache_key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, self._build_flattened_indices())
+            _flatten_cache[cache_key] = cached
+        return [(collection[index], level) for index, level in cached[1]]
+
+    def _build_flattened_indices(self) -> list[tuple[int, int]]:
+        """Return (collection index, level) pairs in display order."""
+        # Group children by parent in a single pass instead of rescanning the
+        # whole collection for every folder
+        children_map = {}
+        for index, item in enumerate(getattr(self, self.collection_name)):
+            children_map.setdefault(item.parent_id, []).append((item.order, index, item))
+
+        collected = []
         def collect_items(parent_id, level):
-            collected = []
-            children = sorted(
-                [item for item in getattr(self, self.collection_name) if item.parent_id == parent_id],
-                key=lambda i: i.order
-            )
-            for item in children:
-                collected.append((item, level))
+            children = children_map.get(parent_id)
+            if not children:
+                return
+            children.sort(key=lambda entry: entry[0])
+            for _, index, item in children:
+                collected.append((index, level))
                 if item.type == 'FOLDER':
-                    collected.extend(collect_items(item.id, level + 1))
-            return collected
-        return collect_items(-1, 0)
+                    collect_items(item.id, level + 1)
+        collect_items(-1, 0)
+        return collected
     
     def get_item_level_from_id(self, item_id):
         """Get the level of an item in the hierarchy"""
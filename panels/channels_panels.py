@@ -4,14 +4,21 @@ from bpy.utils import register_classes_factory
 from bpy_extras.node_utils import find_base_socket_type
 
 from ..paintsystem.data import CHANNEL_TEMPLATE_ENUM
+from ..paintsystem.context import PSContext, parse_ui_context
 from .common import (
     PSContextMixin,
+    use_property_split_layout,
     get_icon_from_channel,
     check_group_multiuser,
     get_icon,
     ensure_invoke_context,
 )
 
+def get_available_channel_templates(channels) -> list:
+    """CHANNEL_TEMPLATE_ENUM entries whose channel name is not used in *channels* yet."""
+    channel_names = {channel.name for channel in channels}
+    return [template for template in CHANNEL_TEMPLATE_ENUM if template[1] not in channel_names]
+
 class MAT_MT_PaintSystemChannelsMergeAndExport(PSContextMixin, Menu):
     bl_label = "Baked and Export"
     bl_idname = "MAT_MT_PaintSystemChannelsMergeAndExport"
@@ -45,8 +52,7 @@ class PAINTSYSTEM_UL_channels(PSContextMixin, UIList):
             icon_row.label(icon_value=get_icon_from_channel(channel))
             icon_row.prop(channel, "name", text="", emboss=False)
             
-            bake_row = row.row(align=True)
-            bake_row.label(text="Baked", icon="TEXTURE_DATA")
+            row.label(text="Baked", icon="TEXTURE_DATA")
             return
         split = layout.split(factor=0.7)
         group_node = ps_ctx.active_group.get_group_node(ps_ctx.active_material.node_tree)
@@ -69,7 +75,7 @@ class PAINTSYSTEM_UL_channels(PSContextMixin, UIList):
     #     return flt_flags, flt_neworder
 
 def draw_channels_list(context, layout):
-    ps_ctx = PSContextMixin.parse_context(context)
+    ps_ctx = parse_ui_context(context)
     row = layout.row()
     row.template_list(
         "PAINTSYSTEM_UL_channels", 
@@ -81,7 +87,7 @@ def draw_channels_list(context, layout):
         rows=max(len(ps_ctx.active_group.channels), 3),
     )
     col = row.column(align=True)
-    available_templates = [template for template in CHANNEL_TEMPLATE_ENUM if not any(channel.name == template[1] for channel in ps_ctx.active_group.channels)]
+    available_templates = get_available_channel_templates(ps_ctx.active_group.channels)
     if available_templates:
         col.operator("wm.call_menu", icon='ADD', text="").name = "MAT_MT_AddChannelMenu"
     else:
@@ -105,14 +111,17 @@ class MAT_PT_ChannelsSelect(PSContextMixin, Panel):
         col.label(text="Channels")
         draw_channels_list(context, col)
 
-def poll_channels_panel(context: Context):
-    ps_ctx = PSContextMixin.parse_context(context)
-    if ps_ctx.active_group and check_group_multiuser(ps_ctx.active_group.node_tree):
+def poll_channels_panel(context: Context, ps_ctx: PSContext | None = None):
+    if ps_ctx is None:
+        ps_ctx = parse_ui_context(context)
+    active_group = ps_ctx.active_group
+    if not ps_ctx.ps_mat_data or active_group is None:
         return False
-    return ps_ctx.ps_mat_data and ps_ctx.active_group is not None
+    return not check_group_multiuser(active_group.node_tree)
 
-def draw_channels_panel(layout: UILayout, context: Context):
-    ps_ctx = PSContextMixin.parse_context(context)
+def draw_channels_panel(layout: UILayout, context: Context, ps_ctx: PSContext | None = None):
+    if ps_ctx is None:
+        ps_ctx = parse_ui_context(context)
     box = layout.box()
     if ps_ctx.ps_settings.use_legacy_ui:
         box.menu("MAT_MT_PaintSystemChannelsMergeAndExport", icon="TEXTURE_DATA", text="Bake and Export")
@@ -154,7 +163,7 @@ class MAT_PT_ChannelsPanel(PSContextMixin, Panel):
         draw_channels_panel(layout, context)
 
 def draw_channels_settings_panel(layout: UILayout, context: Context):
-    ps_ctx = PSContextMixin.parse_context(context)
+    ps_ctx = parse_ui_context(context)
     active_channel = ps_ctx.active_channel
     if active_channel.bake_image:
         row = layout.row(align=True)
@@ -165,8 +174,7 @@ def draw_channels_settings_panel(layout: UILayout, context: Context):
         if active_channel.type == "VECTOR":
             col.prop(active_channel, "bake_vector_space", text="")
         return
-    col.use_property_split = True
-    col.use_property_decorate = False
+    use_property_split_layout(col)
     col.prop(active_channel, "type", text="Type")
     col.prop(active_channel, "color_space", text="Color Space")
     col.prop(active_channel, "use_alpha", text="Use Alpha")
@@ -245,11 +253,11 @@ class MAT_MT_AddChannelMenu(PSContextMixin, Menu):
         col = layout.column()
         col.operator("paint_system.add_channel", text="Custom Channel", icon_value=get_icon('channels')).template = "CUSTOM"
         col.separator()
-        available_templates = [template for template in CHANNEL_TEMPLATE_ENUM if not any(channel.name == template[1] for channel in ps_ctx.active_group.channels)]
+        available_templates = get_available_channel_templates(ps_ctx.active_group.channels)
         if available_templates:
             col.label(text="Templates")
-            for template in available_templates:
-                col.operator("paint_system.add_channel", text=template[1], icon_value=template[3]).template = template[0]
+            for identifier, name, _description, icon_value, _index in available_templates:
+                col.operator("paint_system.add_channel", text=name, icon_value=icon_value).template = identifier
 
 classes = (
     MAT_MT_PaintSystemChannelsMergeAndExport,
@@ -1,42 +1,161 @@
 import bpy
 from bpy.types import Image, ImagePreview
+from collections import OrderedDict
+import textwrap
+import time
 import numpy as np
 
 from ..utils.version import is_newer_than
 
 # --
 from ..paintsystem.data import Channel, Layer
-from ..paintsystem.context import PSContextMixin
+from ..paintsystem.context import PSContext, PSContextMixin, parse_ui_context
 from ..custom_icons import get_icon, get_icon_from_socket_type
 from ..preferences import get_preferences
-from ..utils.nodes import find_node, get_material_output, traverse_connected_nodes
+from ..utils.nodes import find_node, find_node_cached, get_material_output, traverse_connected_nodes
 
-def scale_content(context, layout, scale_x=1.2, scale_y=1.2):
-    """Scale the content of the panel."""
-    prefs = get_preferences(context)
+def scale_content(context, layout, scale_x=1.2, scale_y=1.2, prefs=None):
+    """Scale the content of the panel.
+
+    Draw code that already holds the preferences (ps_ctx.ps_settings) should
+    pass them as *prefs* to skip the addon preferences lookup.
+    """
+    if prefs is None:
+        prefs = get_preferences(context)
     if not prefs.use_compact_design:
         layout.scale_x = scale_x
         layout.scale_y = scale_y
     return layout
 
-icons = bpy.types.UILayout.bl_rna.functions["prop"].parameters["icon"].enum_items.keys()
+icons = frozenset(bpy.types.UILayout.bl_rna.functions["prop"].parameters["icon"].enum_items.keys())
+
+def use_property_split_layout(layout: bpy.types.UILayout):
+    """Switch *layout* to split property rows without decorators."""
+    layout.use_property_split = True
+    layout.use_property_decorate = False
+
 
 def icon_parser(icon: str, default="NONE") -> str:
     if icon in icons:
         return icon
     return default
 
+# Version-dependent icon names, resolved once instead of on every row draw
+LOCKED_ICON = icon_parser('VIEW_LOCKED', 'LOCKED')
+SOLID_COLOR_ICON = icon_parser('STRIP_COLOR_03', "SEQUENCE_COLOR_03")
+INFO_ICON = 'INFO_LARGE' if is_newer_than(4, 3) else 'INFO'
 
-def get_icon_from_channel(channel: Channel) -> int:
-    type_to_icon = {
-        'COLOR': 'color_socket',
-        'VECTOR': 'vector_socket',
-        'FLOAT': 'float_socket',
-    }
-    return get_icon(type_to_icon.get(channel.type, 'color_socket'))
-
+# The Blender version is fixed for the session, so draw code reads these
+# instead of calling is_newer_than on every redraw
+BL_GE_4_2 = is_newer_than(4, 2)
+BL_GE_4_3 = is_newer_than(4, 3)
+BL_GE_5_0 = is_newer_than(5, 0)
 
 
+def get_icon_from_channel(channel: Channel) -> int:
+    return get_icon_from_socket_type(channel.type)
+
+
+
+# Keymap event types mapped to their Blender icons
+EVENT_KEY_ICONS = {
+    # Mouse
+    'LEFTMOUSE': 'MOUSE_LMB',
+    'RIGHTMOUSE': 'MOUSE_RMB',
+    'MIDDLEMOUSE': 'MOUSE_MMB',
+    'WHEELUPMOUSE': 'MOUSE_LMB_DRAG',
+    'WHEELDOWNMOUSE': 'MOUSE_LMB_DRAG',
+
+    # Special keys
+    'ESC': 'EVENT_ESC',
+    'RET': 'EVENT_RETURN',
+    'SPACE': 'EVENT_SPACEKEY',
+    'TAB': 'EVENT_TAB',
+    'DEL': 'EVENT_DELETEKEY',
+    'BACK_SPACE': 'EVENT_BACKSPACEKEY',
+    'COMMA': 'EVENT_COMMA',
+    'PERIOD': 'EVENT_PERIOD',
+    'SEMI_COLON': 'EVENT_SEMI_COLON',
+    'QUOTE': 'EVENT_QUOTE',
+
+    # Numbers
+    '0': 'EVENT_0',
+    '1': 'EVENT_1',
+    '2': 'EVENT_2',
+    '3': 'EVENT_3',
+    '4': 'EVENT_4',
+    '5': 'EVENT_5',
+    '6': 'EVENT_6',
+    '7': 'EVENT_7',
+    '8': 'EVENT_8',
+    '9': 'EVENT_9',
+
+    # Letters
+    'A': 'EVENT_A',
+    'B': 'EVENT_B',
+    'C': 'EVENT_C',
+    'D': 'EVENT_D',
+    'E': 'EVENT_E',
+    'F': 'EVENT_F',
+    'G': 'EVENT_G',
+    'H': 'EVENT_H',
+    'I': 'EVENT_I',
+    'J': 'EVENT_J',
+    'K': 'EVENT_K',
+    'L': 'EVENT_L',
+    'M': 'EVENT_M',
+    'N': 'EVENT_N',
+    'O': 'EVENT_O',
+    'P': 'EVENT_P',
+    'Q': 'EVENT_Q',
+    'R': 'EVENT_R',
+    'S': 'EVENT_S',
+    'T': 'EVENT_T',
+    'U': 'EVENT_U',
+    'V': 'EVENT_V',
+    'W': 'EVENT_W',
+    'X': 'EVENT_X',
+    'Y': 'EVENT_Y',
+    'Z': 'EVENT_Z',
+
+    # Function keys
+    'F1': 'EVENT_F1',
+    'F2': 'EVENT_F2',
+    'F3': 'EVENT_F3',
+    'F4': 'EVENT_F4',
+    'F5': 'EVENT_F5',
+    'F6': 'EVENT_F6',
+    'F7': 'EVENT_F7',
+    'F8': 'EVENT_F8',
+    'F9': 'EVENT_F9',
+    'F10': 'EVENT_F10',
+    'F11': 'EVENT_F11',
+    'F12': 'EVENT_F12',
+
+    # Arrows
+    'LEFT_ARROW': 'EVENT_LEFT_ARROW',
+    'RIGHT_ARROW': 'EVENT_RIGHT_ARROW',
+    'UP_ARROW': 'EVENT_UP_ARROW',
+    'DOWN_ARROW': 'EVENT_DOWN_ARROW',
+
+    # Numpad
+    'NUMPAD_0': 'EVENT_0',
+    'NUMPAD_1': 'EVENT_1',
+    'NUMPAD_2': 'EVENT_2',
+    'NUMPAD_3': 'EVENT_3',
+    'NUMPAD_4': 'EVENT_4',
+    'NUMPAD_5': 'EVENT_5',
+    'NUMPAD_6': 'EVENT_6',
+    'NUMPAD_7': 'EVENT_7',
+    'NUMPAD_8': 'EVENT_8',
+    'NUMPAD_9': 'EVENT_9',
+    'NUMPAD_PLUS': 'EVENT_PLUS',
+    'NUMPAD_MINUS': 'EVENT_MINUS',
+    'NUMPAD_ASTERIX': 'EVENT_ASTERISK',
+    'NUMPAD_SLASH': 'EVENT_SLASH',
+    'NUMPAD_PERIOD': 'EVENT_PERIOD',
+    'NUMPAD_ENTER': 'EVENT_RETURN',
+}
 
 def get_event_icons(kmi: bpy.types.KeyMapItem) -> list[str]:
     """Return a list of icons for a keymap item, including modifiers
@@ -63,118 +182,15 @@ def get_event_icons(kmi: bpy.types.KeyMapItem) -> list[str]:
     if kmi.oskey:
         icons.append('EVENT_OS')
 
-    # Dictionary mapping key types to icons
-    key_icons = {
-        # Mouse
-        'LEFTMOUSE': 'MOUSE_LMB',
-        'RIGHTMOUSE': 'MOUSE_RMB',
-        'MIDDLEMOUSE': 'MOUSE_MMB',
-        'WHEELUPMOUSE': 'MOUSE_LMB_DRAG',
-        'WHEELDOWNMOUSE': 'MOUSE_LMB_DRAG',
-
-        # Special keys
-        'ESC': 'EVENT_ESC',
-        'RET': 'EVENT_RETURN',
-        'SPACE': 'EVENT_SPACEKEY',
-        'TAB': 'EVENT_TAB',
-        'DEL': 'EVENT_DELETEKEY',
-        'BACK_SPACE': 'EVENT_BACKSPACEKEY',
-        'COMMA': 'EVENT_COMMA',
-        'PERIOD': 'EVENT_PERIOD',
-        'SEMI_COLON': 'EVENT_SEMI_COLON',
-        'QUOTE': 'EVENT_QUOTE',
-
-        # Numbers
-        '0': 'EVENT_0',
-        '1': 'EVENT_1',
-        '2': 'EVENT_2',
-        '3': 'EVENT_3',
-        '4': 'EVENT_4',
-        '5': 'EVENT_5',
-        '6': 'EVENT_6',
-        '7': 'EVENT_7',
-        '8': 'EVENT_8',
-        '9': 'EVENT_9',
-
-        # Letters
-        'A': 'EVENT_A',
-        'B': 'EVENT_B',
-        'C': 'EVENT_C',
-        'D': 'EVENT_D',
-        'E': 'EVENT_E',
-        'F': 'EVENT_F',
-        'G': 'EVENT_G',
-        'H': 'EVENT_H',
-        'I': 'EVENT_I',
-        'J': 'EVENT_J',
-        'K': 'EVENT_K',
-        'L': 'EVENT_L',
-        'M': 'EVENT_M',
-        'N': 'EVENT_N',
-        'O': 'EVENT_O',
-        'P': 'EVENT_P',
-        'Q': 'EVENT_Q',
-        'R': 'EVENT_R',
-        'S': 'EVENT_S',
-        'T': 'EVENT_T',
-        'U': 'EVENT_U',
-        'V': 'EVENT_V',
-        'W': 'EVENT_W',
-        'X': 'EVENT_X',
-        'Y': 'EVENT_Y',
-        'Z': 'EVENT_Z',
-
-        # Function keys
-        'F1': 'EVENT_F1',
-        'F2': 'EVENT_F2',
-        'F3': 'EVENT_F3',
-        'F4': 'EVENT_F4',
-        'F5': 'EVENT_F5',
-        'F6': 'EVENT_F6',
-        'F7': 'EVENT_F7',
-        'F8': 'EVENT_F8',
-        'F9': 'EVENT_F9',
-        'F10': 'EVENT_F10',
-        'F11': 'EVENT_F11',
-        'F12': 'EVENT_F12',
-
-        # Arrows
-        'LEFT_ARROW': 'EVENT_LEFT_ARROW',
-        'RIGHT_ARROW': 'EVENT_RIGHT_ARROW',
-        'UP_ARROW': 'EVENT_UP_ARROW',
-        'DOWN_ARROW': 'EVENT_DOWN_ARROW',
-
-        # Numpad
-        'NUMPAD_0': 'EVENT_0',
-        'NUMPAD_1': 'EVENT_1',
-        'NUMPAD_2': 'EVENT_2',
-        'NUMPAD_3': 'EVENT_3',
-        'NUMPAD_4': 'EVENT_4',
-        'NUMPAD_5': 'EVENT_5',
-        'NUMPAD_6': 'EVENT_6',
-        'NUMPAD_7': 'EVENT_7',
-        'NUMPAD_8': 'EVENT_8',
-        'NUMPAD_9': 'EVENT_9',
-        'NUMPAD_PLUS': 'EVENT_PLUS',
-        'NUMPAD_MINUS': 'EVENT_MINUS',
-        'NUMPAD_ASTERIX': 'EVENT_ASTERISK',
-        'NUMPAD_SLASH': 'EVENT_SLASH',
-        'NUMPAD_PERIOD': 'EVENT_PERIOD',
-        'NUMPAD_ENTER': 'EVENT_RETURN',
-    }
-
-    # Add the key icon if it exists in our mapping
-    if kmi.type in key_icons:
-        icons.append(key_icons[kmi.type])
-    else:
-        # Fall back to a generic keyboard icon for unknown keys
-        icons.append('KEYINGSET')
+    # Add the key icon if it exists in our mapping, falling back to a
+    # generic keyboard icon for unknown keys
+    icons.append(EVENT_KEY_ICONS.get(kmi.type, 'KEYINGSET'))
 
     return icons
 
-def find_keymap(keymap_name):
+def find_keymap(keymap_name, use_user_keyconfig=False):
     wm = bpy.context.window_manager
-    kc = wm.keyconfigs.addon
+    kc = wm.keyconfigs.user if use_user_keyconfig else wm.keyconfigs.addon
     if kc:
         for km in kc.keymaps:
             if km:
@@ -183,26 +199,57 @@ def find_keymap(keymap_name):
                     return kmi
     return None
 
-def find_keymap_by_name(keymap_name) -> list[bpy.types.KeyMapItem]:
-    wm = bpy.context.window_manager
-    kc = wm.keyconfigs.user
-    if kc:
-        for km in kc.keymaps:
-            if km:
-                for kmi in km.keymap_items:
-                    if kmi.name == keymap_name:
-                        return kmi
-    return None
+# Module-level cache for check_group_multiuser, keyed by node tree pointer:
+# {pointer: (material count, is multiuser)}
+_multiuser_cache: dict[int, tuple[int, bool]] = {}
+
+def invalidate_group_multiuser_cache():
+    """Forget all cached check_group_multiuser results."""
+    _multiuser_cache.clear()
 
 def check_group_multiuser(group_node_tree: bpy.types.NodeTree) -> bool:
+    """Whether more than one Paint System group uses *group_node_tree*.
+
+    Polls and draws call this on every redraw, so results are cached until
+    the material count changes or invalidate_group_multiuser_cache runs.
+    """
+    material_count = len(bpy.data.materials)
+    cache_key = group_node_tree.as_pointer() if group_node_tree else 0
+    cached = _multiuser_cache.get(cache_key)
+    if cached is not None and cached[0] == material_count:
+        return cached[1]
     user_count = 0
     for mat in bpy.data.materials:
-        if hasattr(mat, "ps_mat_data") and mat.ps_mat_data.groups:
+        if mat.ps_mat_data.groups:
             for group in mat.ps_mat_data.groups:
                 if group.node_tree == group_node_tree:
                     user_count += 1
-    return user_count > 1
+    is_multiuser = user_count > 1
+    _multiuser_cache[cache_key] = (material_count, is_multiuser)
+    return is_multiuser
+
 
+# Module-level cache for the UDIM tiles label, keyed by image name:
+# {name_full: (tile count, label)}
+_udim_tiles_label_cache: dict[str, tuple[int, str]] = {}
+
+def invalidate_udim_tiles_label_cache(image: Image | None = None):
+    """Forget cached UDIM tile labels for an image or all images."""
+    if image is None:
+        _udim_tiles_label_cache.clear()
+        return
+    _udim_tiles_label_cache.pop(image.name_full, None)
+
+def get_udim_tiles_label(image: Image) -> str:
+    """Label listing the tile numbers of *image*, rebuilt only when the tile count changes."""
+    tiles = image.tiles
+    tile_count = len(tiles)
+    cached = _udim_tiles_label_cache.get(image.name_full)
+    if cached is not None and cached[0] == tile_count:
+        return cached[1]
+    label = "UDIM tiles: " + ", ".join(str(t.number) for t in tiles)
+    _udim_tiles_label_cache[image.name_full] = (tile_count, label)
+    return label
 
 def image_node_settings(layout: bpy.types.UILayout, image_node: bpy.types.Node, data, propname="image", text="", icon="NONE", icon_value=None, default_closed=True, simple_ui=False):
     if simple_ui:
@@ -226,8 +273,7 @@ def image_node_settings(layout: bpy.types.UILayout, image_node: bpy.types.Node,
             if icon_value:
                 col.label(text=text, icon_value=icon_value)
             col.separator()
-        col.use_property_split = True
-        col.use_property_decorate = False
+        use_property_split_layout(col)
         image = image_node.image
         if not simple_ui and image:
             row = col.row(align=True)
@@ -236,7 +282,7 @@ def image_node_settings(layout: bpy.types.UILayout, image_node: bpy.types.Node,
                     text="", icon='COLLAPSEMENU')
             col.separator()
         if image:
-            col.label(text="UDIM tiles: " + ", ".join(str(t.number) for t in image.tiles), icon='UV')
+            col.label(text=get_udim_tiles_label(image), icon='UV')
         col.prop(image_node, "interpolation",
                     text="")
         col.prop(image_node, "projection",
@@ -252,23 +298,25 @@ def image_node_settings(layout: bpy.types.UILayout, image_node: bpy.types.Node,
     return panel
 
 
+# Node types a freshly created Paint System material is wired up with
+BASIC_SETUP_NODE_TYPES = frozenset({'ShaderNodeGroup', 'ShaderNodeMixShader', 'ShaderNodeBsdfTransparent'})
+
 def is_basic_setup(node_tree: bpy.types.NodeTree) -> bool:
     material_output = get_material_output(node_tree)
     nodes = traverse_connected_nodes(material_output)
-    is_basic_setup = True
     if len(nodes) <= 1:
         return True
     # Only first 3 nodes
-    for check in ('ShaderNodeGroup', 'ShaderNodeMixShader', 'ShaderNodeBsdfTransparent'):
-        if not any(node.bl_idname == check for node in nodes):
-            is_basic_setup = False
-            break
-    return is_basic_setup
+    return BASIC_SETUP_NODE_TYPES.issubset(node.bl_idname for node in nodes)
+
 
+# Group templates whose Normal channel shows the normal painting tip
+NORMAL_TIP_TEMPLATES = frozenset({'NORMAL', 'PBR'})
 
-def toggle_paint_mode_ui(layout: bpy.types.UILayout, context: bpy.types.Context):
+def toggle_paint_mode_ui(layout: bpy.types.UILayout, context: bpy.types.Context, ps_ctx: PSContext | None = None):
     current_mode = context.mode
-    ps_ctx = PSContextMixin.parse_context(context)
+    if ps_ctx is None:
+        ps_ctx = parse_ui_context(context)
     active_group = ps_ctx.active_group
     active_channel = ps_ctx.active_channel
     mat = ps_ctx.active_material
@@ -280,9 +328,10 @@ def toggle_paint_mode_ui(layout: bpy.types.UILayout, context: bpy.types.Context)
     paint_row.operator("paint_system.toggle_paint_mode",
         text="Toggle Paint Mode", depress=current_mode == 'PAINT_TEXTURE', icon_value=get_icon('paintbrush'))
     
-    group_node = find_node(mat.node_tree, {
+    group_node = find_node_cached(mat.node_tree, {
                                 'bl_idname': 'ShaderNodeGroup', 'node_tree': active_group.node_tree})
-    if (not is_basic_setup(mat.node_tree) or len(active_group.channels) > 1 or ps_ctx.ps_mat_data.preview_channel) and group_node:
+    # is_basic_setup walks the whole node graph, so it goes last
+    if group_node and (len(active_group.channels) > 1 or ps_ctx.ps_mat_data.preview_channel or not is_basic_setup(mat.node_tree)):
                 row.operator("paint_system.isolate_active_channel",
                             text="", depress=ps_ctx.ps_mat_data.preview_channel, icon_value=get_icon_from_channel(ps_ctx.active_channel) if ps_ctx.ps_mat_data.preview_channel else get_icon("channel"))
     row.operator("wm.save_mainfile",
@@ -292,7 +341,7 @@ def toggle_paint_mode_ui(layout: bpy.types.UILayout, context: bpy.types.Context)
     
     if ps_ctx.ps_object.type == 'MESH':
         paint_row.enabled = not active_channel.use_bake_image
-        if ps_ctx.ps_settings.show_tooltips and not ps_ctx.ps_settings.hide_norm_paint_tips and active_group.template in {'NORMAL', 'PBR'} and any(channel.name == 'Normal' for channel in active_group.channels) and active_channel.name == 'Normal':
+        if active_channel.name == 'Normal' and active_group.template in NORMAL_TIP_TEMPLATES and ps_ctx.ps_settings.show_tooltips and not ps_ctx.ps_settings.hide_norm_paint_tips:
             row = col.row(align=True)
             row.scale_y = 1.5
             row.scale_x = 1.5
@@ -313,8 +362,9 @@ def toggle_paint_mode_ui(layout: bpy.types.UILayout, context: bpy.types.Context)
         row.menu("MAT_MT_PaintSystemMergeAndExport",
                     text="Bake and Export")
 
-def layer_settings_ui(layout: bpy.types.UILayout, context: bpy.types.Context):
-    ps_ctx = PSContextMixin.parse_context(context)
+def layer_settings_ui(layout: bpy.types.UILayout, context: bpy.types.Context, ps_ctx: PSContext | None = None):
+    if ps_ctx is None:
+        ps_ctx = parse_ui_context(context)
     active_layer = ps_ctx.active_layer
     if not active_layer or not active_layer.node_tree:
         return
@@ -325,7 +375,7 @@ def layer_settings_ui(layout: bpy.types.UILayout, context: bpy.types.Context):
         row = col.row(align=True)
         row.scale_y = 1.2
         row.scale_x = 1.2
-        scale_content(context, row, 1.7, 1.5)
+        scale_content(context, row, 1.7, 1.5, prefs=ps_ctx.ps_settings)
         clip_row = row.row(align=True)
         clip_row.enabled = not active_layer.lock_layer
         clip_row.prop(active_layer, "is_clip", text="",
@@ -335,12 +385,12 @@ def layer_settings_ui(layout: bpy.types.UILayout, context: bpy.types.Context):
                     text="", icon='TEXTURE')
         lock_row = row.row(align=True)
         lock_row.prop(active_layer, "lock_layer",
-                text="", icon=icon_parser('VIEW_LOCKED', 'LOCKED'))
+                text="", icon=LOCKED_ICON)
         blend_type_row = row.row(align=True)
         blend_type_row.enabled = not active_layer.lock_layer
         blend_type_row.prop(active_layer, "blend_mode", text="")
         row = col.row(align=True)
-        scale_content(context, row, scale_x=1.2, scale_y=1.5)
+        scale_content(context, row, scale_x=1.2, scale_y=1.5, prefs=ps_ctx.ps_settings)
         row.enabled = not active_layer.lock_layer
         row.prop(active_layer.pre_mix_node.inputs['Opacity'], "default_value",
                 text="Opacity", slider=True)
@@ -365,7 +415,7 @@ def layer_settings_ui(layout: bpy.types.UILayout, context: bpy.types.Context):
                     text="", icon='TEXTURE')
         lock_row = main_row.row(align=True)
         lock_row.prop(active_layer, "lock_layer",
-                text="", icon=icon_parser('VIEW_LOCKED', 'LOCKED'))
+                text="", icon=LOCKED_ICON)
         blend_type_row = main_row.row(align=True)
         blend_type_row.enabled = not active_layer.lock_layer
         blend_type_row.prop(active_layer, "blend_mode", text="")
@@ -377,7 +427,7 @@ def layer_settings_ui(layout: bpy.types.UILayout, context: bpy.types.Context):
                 text="" if use_wide_ui else "Opacity", slider=True)
 
 def line_separator(layout: bpy.types.UILayout):
-    if is_newer_than(4, 2):
+    if BL_GE_4_2:
         layout.separator(type = 'LINE')
     else:
         layout.separator()
@@ -385,9 +435,65 @@ def line_separator(layout: bpy.types.UILayout):
 def is_editor_open(context: bpy.types.Context, editor_type: str) -> bool:
     return any(area.type == editor_type for area in context.screen.areas)
 
+# Module-level LRU cache for is_image_painted results
+_IMAGE_PAINTED_CACHE_SIZE = 256
+_image_painted_cache: OrderedDict[tuple, bool] = OrderedDict()
+
+# Reusable buffers for preview-sized foreach_get reads, one per dtype. UI
+# drawing is single-threaded, so sharing them between calls is safe.
+_PIXEL_BUFFER_MAX_SIZE = 256 * 256 * 4
+_pixel_buffers: dict[type, np.ndarray] = {}
+
+def _get_pixel_buffer(size: int, dtype=np.float32) -> np.ndarray:
+    """Return an uninitialised buffer of *size*, reusing it when small."""
+    if size > _PIXEL_BUFFER_MAX_SIZE:
+        return np.empty(size, dtype=dtype)
+    buffer = _pixel_buffers.get(dtype)
+    if buffer is None or len(buffer) < size:
+        buffer = _pixel_buffers[dtype] = np.empty(size, dtype=dtype)
+    return buffer[:size]
+
+_ANY_NONZERO_CHUNK_SIZE = 4096
+
+def _any_nonzero(buffer: np.ndarray) -> bool:
+    """Return True on the first chunk of *buffer* holding a non-zero value."""
+    for start in range(0, len(buffer), _ANY_NONZERO_CHUNK_SIZE):
+        if buffer[start:start + _ANY_NONZERO_CHUNK_SIZE].any():
+            return True
+    return False
+
+def _is_untouched_blank_image(image: Image) -> bool:
+    """Whether image metadata alone shows the image has no pixel data."""
+    return (
+        image.source == 'GENERATED'
+        and not image.is_dirty
+        and not image.packed_file
+        and image.generated_type == 'BLANK'
+        and not any(image.generated_color)
+    )
+
+def _get_image_painted_key(image: Image | ImagePreview) -> tuple:
+    """Build a cache key from the owning image's name and the pixel dimensions."""
+    if isinstance(image, Image):
+        return ('IMAGE', image.name_full, tuple(image.size))
+    owner = image.id_data
+    return ('PREVIEW', owner.name_full if owner else image.as_pointer(), tuple(image.image_size))
+
+def invalidate_image_painted_cache(image: Image | None = None):
+    """Forget cached is_image_painted results for an image or all images."""
+    if image is None:
+        _image_painted_cache.clear()
+        return
+    name = image.name_full
+    for key in [key for key in _image_painted_cache if key[1] == name]:
+        del _image_painted_cache[key]
+
 def is_image_painted(image: Image | ImagePreview | None) -> bool:
     """Check if the image is painted
 
+    Results are cached by image name and size, so redraws only pay for a
+    dict lookup. Call invalidate_image_painted_cache when the pixels change.
+
     Args:
         image (bpy.types.Image): The image to check
 
@@ -396,31 +502,124 @@ def is_image_painted(image: Image | ImagePreview | None) -> bool:
     """
     if not image:
         return False
+    if isinstance(image, Image) and _is_untouched_blank_image(image):
+        return False
+    if isinstance(image, ImagePreview) and not image.image_size[0]:
+        return False
+    key = _get_image_painted_key(image)
+    result = _image_painted_cache.get(key)
+    if result is not None:
+        _image_painted_cache.move_to_end(key)
+        return result
     if isinstance(image, Image):
-        pixels = np.zeros(len(image.pixels), dtype=np.float32)
+        pixels = _get_pixel_buffer(len(image.pixels))
         image.pixels.foreach_get(pixels)
-        return len(pixels) > 0 and any(pixels)
+        result = _any_nonzero(pixels)
     elif isinstance(image, ImagePreview):
-        pixels = np.zeros(len(image.image_pixels_float), dtype=np.float32)
-        image.image_pixels_float.foreach_get(pixels)
-        return len(pixels) > 0 and any(pixels)
+        # Packed RGBA ints: one value per pixel instead of four floats,
+        # and a pixel is non-zero exactly when one of its channels is.
+        pixels = _get_pixel_buffer(len(image.image_pixels), np.int32)
+        image.image_pixels.foreach_get(pixels)
+        result = _any_nonzero(pixels)
+    else:
+        return False
+    _image_painted_cache[key] = result
+    if len(_image_painted_cache) > _IMAGE_PAINTED_CACHE_SIZE:
+        _image_painted_cache.popitem(last=False)
+    return result
+
+# Names of images whose previews are waiting for a deferred is_image_painted check
+_painted_pending: set[str] = set()
+# Checks run per timer tick, so a file full of images never stalls the UI
+_PAINTED_QUEUE_BATCH_SIZE = 8
+_PAINTED_QUEUE_INTERVAL = 0.01
+# Editors that show image previews and need a redraw once one turns out painted
+_PAINTED_REDRAW_AREA_TYPES = frozenset({'VIEW_3D', 'NODE_EDITOR'})
+
+def _process_painted_queue():
+    """Timer callback: run a batch of pending is_image_painted checks, then redraw."""
+    found_painted = False
+    for _ in range(min(_PAINTED_QUEUE_BATCH_SIZE, len(_painted_pending))):
+        image = bpy.data.images.get(_painted_pending.pop())
+        if image and image.preview and is_image_painted(image.preview):
+            found_painted = True
+    # Unpainted images already show the generic icon, so only redraw on a change
+    if found_painted:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type in _PAINTED_REDRAW_AREA_TYPES:
+                    area.tag_redraw()
+    return _PAINTED_QUEUE_INTERVAL if _painted_pending else None
+
+def is_image_painted_deferred(image: Image) -> bool:
+    """Return the cached painted state of an image's preview without reading pixels.
+
+    Unknown previews report False and are checked on a timer, which tags the
+    UI for redraw once the answer is cached.
+    """
+    if _is_untouched_blank_image(image):
+        return False
+    preview = image.preview
+    if not preview or not preview.image_size[0]:
+        return False
+    result = _image_painted_cache.get(_get_image_painted_key(preview))
+    if result is not None:
+        return result
+    if not _painted_pending:
+        bpy.app.timers.register(_process_painted_queue, first_interval=_PAINTED_QUEUE_INTERVAL)
+    _painted_pending.add(image.name)
+    return False
+
+# Channel structure signatures already handed to prewarm_image_painted_cache
+_prewarmed_channels: dict[int, bytes] = {}
+
+def invalidate_prewarmed_channels():
+    """Let every channel prewarm its painted checks again."""
+    _prewarmed_channels.clear()
+
+def prewarm_image_painted_cache(channel: Channel):
+    """Queue painted checks for every image layer of *channel* in one batch.
+
+    Runs again only when the channel's layer structure changes, so a single
+    timer pass answers all rows instead of rows queueing as they are drawn.
+    """
+    signature = channel.get_structure_signature()
+    channel_key = channel.as_pointer()
+    if _prewarmed_channels.get(channel_key) == signature:
+        return
+    _prewarmed_channels[channel_key] = signature
+    for layer in channel.layers:
+        layer_data = layer.get_layer_data()
+        if layer_data and layer_data.type == 'IMAGE' and layer_data.image:
+            is_image_painted_deferred(layer_data.image)
 
-def draw_enum_operator_menu(layout: bpy.types.UILayout, enum_items, operator_id: str, type_attr: str, first_icon: str, skip_types=None):
-    """Draw a menu of operators from an enum, giving the first item a distinctive icon.
+def build_enum_operator_items(enum_items, first_icon: str, skip_types=None) -> tuple[tuple[str, str, str], ...]:
+    """Precompute (identifier, name, icon) entries for draw_enum_operator_menu.
 
     Args:
-        layout: The UILayout to draw into.
         enum_items: Iterable of (identifier, name, description) tuples.
-        operator_id: The bl_idname of the operator to invoke.
-        type_attr: The operator property name to set (e.g. 'gradient_type').
         first_icon: Icon string for the first item; others get 'NONE'.
         skip_types: Optional set of identifiers to skip.
     """
-    for idx, (identifier, name, description) in enumerate(enum_items):
-        if skip_types and identifier in skip_types:
-            continue
-        op = layout.operator(operator_id, text=name, icon=first_icon if idx == 0 else 'NONE')
-        setattr(op, type_attr, identifier)
+    return tuple(
+        (identifier, name, first_icon if idx == 0 else 'NONE')
+        for idx, (identifier, name, description) in enumerate(enum_items)
+        if not (skip_types and identifier in skip_types)
+    )
+
+
+def draw_enum_operator_menu(layout: bpy.types.UILayout, menu_items, operator_id: str, type_attr: str):
+    """Draw a menu of operators from entries built by build_enum_operator_items.
+
+    Args:
+        layout: The UILayout to draw into.
+        menu_items: Sequence of (identifier, name, icon) tuples.
+        operator_id: The bl_idname of the operator to invoke.
+        type_attr: The operator property name to set (e.g. 'gradient_type').
+    """
+    operator = layout.operator
+    for identifier, name, icon in menu_items:
+        setattr(operator(operator_id, text=name, icon=icon), type_attr, identifier)
 
 
 def draw_socket_grid(layout: bpy.types.UILayout, layer, include_inputs: bool = True):
@@ -456,8 +655,6 @@ def ensure_invoke_context(layout: bpy.types.UILayout):
     Menus opened via search may default to EXEC_REGION_WIN which skips
     invoke(); this helper normalises that.
     """
-    if layout.operator_context == 'EXEC_REGION_WIN':
-        layout.operator_context = 'INVOKE_REGION_WIN'
     layout.operator_context = 'INVOKE_REGION_WIN'
 
 
@@ -508,6 +705,20 @@ def draw_layer_sidebar(col: bpy.types.UILayout, use_legacy_ui: bool):
     col.operator("paint_system.move_down", icon="TRIA_DOWN", text="")
 
 
+WARNING_TEXT_WRAPPER = textwrap.TextWrapper(width=32) #50 = maximum length
+
+# Wrapped lines per layer warning. Warnings come from a handful of templates,
+# so the cache stays small.
+_wrapped_warning_cache: dict[str, list[str]] = {}
+
+def get_wrapped_warning(warning: str) -> list[str]:
+    """Split *warning* into label-width lines, reusing earlier results."""
+    lines = _wrapped_warning_cache.get(warning)
+    if lines is None:
+        lines = _wrapped_warning_cache[warning] = WARNING_TEXT_WRAPPER.wrap(text=warning)
+    return lines
+
+
 def draw_warning_box(layout: bpy.types.UILayout, lines):
     """Draw an alert box with one or more warning lines.
 
@@ -528,19 +739,54 @@ def draw_warning_box(layout: bpy.types.UILayout, lines):
     return warning_col
 
 
+# Layer types whose list icon depends only on the type
+_STATIC_LAYER_ICONS = {
+    'ADJUSTMENT': 'SHADERFX',
+    'SHADER': 'SHADING_RENDERED',
+    'NODE_GROUP': 'NODETREE',
+    'ATTRIBUTE': 'MESH_DATA',
+    'RANDOM': 'SEQ_HISTOGRAM',
+    'TEXTURE': 'TEXTURE',
+    'GEOMETRY': 'MESH_DATA',
+}
+
+# Minimum seconds between preview regenerations of the same dirty image, and
+# when each image was last regenerated: {name_full: time.monotonic()}
+_PREVIEW_REGEN_INTERVAL = 1.0
+_last_preview_regen: dict[str, float] = {}
+
+def regenerate_image_preview_throttled(image: Image):
+    """Regenerate a dirty image's preview at most once per _PREVIEW_REGEN_INTERVAL.
+
+    The layer list redraws on every mouse move, and an unpainted-looking
+    preview of a dirty image would otherwise be regenerated each time.
+    """
+    now = time.monotonic()
+    name = image.name_full
+    if now - _last_preview_regen.get(name, 0.0) < _PREVIEW_REGEN_INTERVAL:
+        return
+    _last_preview_regen[name] = now
+    image.asset_generate_preview()
+    invalidate_image_painted_cache(image)
+
 def draw_layer_icon(layer: "Layer", layout: bpy.types.UILayout):
-    match layer.type:
+    layer_type = layer.type
+    static_icon = _STATIC_LAYER_ICONS.get(layer_type)
+    if static_icon:
+        layout.label(icon=static_icon)
+        return
+    match layer_type:
         case 'IMAGE':
             if not layer.image:
                 layout.label(icon_value=get_icon('image'))
                 return
             else:
-                if layer.image.preview and is_image_painted(layer.image.preview):
+                if is_image_painted_deferred(layer.image):
                     layout.label(
                         icon_value=layer.image.preview.icon_id)
                 else:
                     if layer.image.is_dirty:
-                        layer.image.asset_generate_preview()
+                        regenerate_image_preview_throttled(layer.image)
                     layout.label(icon_value=get_icon('image'))
         case 'FOLDER':
             layout.prop(layer, "is_expanded", text="", icon_only=True, icon_value=get_icon(
@@ -550,25 +796,11 @@ def draw_layer_icon(layer: "Layer", layout: bpy.types.UILayout):
             if rgb_node:
                 layout.prop(
                     rgb_node.outputs[0], "default_value", text="", icon='IMAGE_RGB_ALPHA')
-        case 'ADJUSTMENT':
-            layout.label(icon='SHADERFX')
-        case 'SHADER':
-            layout.label(icon='SHADING_RENDERED')
-        case 'NODE_GROUP':
-            layout.label(icon='NODETREE')
-        case 'ATTRIBUTE':
-            layout.label(icon='MESH_DATA')
         case 'GRADIENT':
             if layer.gradient_type == 'FAKE_LIGHT':
                 layout.label(icon='LIGHT')
             else:
                 layout.label(icon='COLOR')
-        case 'RANDOM':
-            layout.label(icon='SEQ_HISTOGRAM')
-        case 'TEXTURE':
-            layout.label(icon='TEXTURE')
-        case 'GEOMETRY':
-            layout.label(icon='MESH_DATA')
         case _:
             layout.label(icon='BLANK1')
 
@@ -576,4 +808,18 @@ def draw_indent(layout: bpy.types.UILayout, level: int):
     row = layout.row(align=True)
     for _ in range(level):
         row.separator()
-    return row.column()
\ No newline at end of file
+    return row.column()
+
+def draw_layer_indent(row: bpy.types.UILayout, level: int):
+    """Draw the hierarchy indent for a layer row.
+
+    All but the innermost level share one blank label widened with scale_x,
+    so a row costs at most two labels regardless of depth.
+    """
+    if level <= 0:
+        return
+    if level > 1:
+        spacer = row.row(align=True)
+        spacer.scale_x = level - 1
+        spacer.label(icon='BLANK1')
+    row.label(icon_value=get_icon('folder_indent'))
@@ -1,17 +1,41 @@
 from bl_ui.properties_material import EEVEE_MATERIAL_PT_context_material
 import bpy
+from functools import lru_cache
 from bpy.types import NodeTree, Panel, Menu, UILayout, Context
 from bpy.utils import register_classes_factory
 
-from .common import PSContextMixin, draw_layer_icon, get_event_icons, find_keymap, find_keymap_by_name, get_icon_from_channel, scale_content, get_icon
-from ..utils.version import is_newer_than
+from .common import PSContextMixin, draw_layer_icon, draw_layer_indent, get_event_icons, find_keymap, get_icon_from_channel, scale_content, get_icon, use_property_split_layout, INFO_ICON, BL_GE_4_3, BL_GE_5_0
 from ..utils.unified_brushes import get_unified_settings
+from ..utils.version import HAS_TOOL_SETTINGS_UNIFIED_PAINT
+from ..paintsystem.context import PSContext, parse_ui_context
 from ..utils.nodes import is_in_nodetree
+from ..preferences import addon_package
 
 from bl_ui.properties_paint_common import (
     UnifiedPaintPanel,
     brush_settings,
 )
+from bl_ui.space_toolsystem_common import ToolSelectPanelHelper
+
+# Bforartists/Blender variants may not expose color_jitter_panel
+try:
+    from bl_ui.properties_paint_common import color_jitter_panel
+except ImportError:
+    color_jitter_panel = None
+
+BRUSH_SETTINGS_MODES = frozenset({'PAINT_TEXTURE', 'PAINT_GREASE_PENCIL', 'VERTEX_GREASE_PENCIL', 'WEIGHT_GREASE_PENCIL', 'SCULPT_GREASE_PENCIL'})
+GP_NO_COLOR_TOOLS = frozenset({"builtin.cutter", "builtin.eyedropper", "builtin.interpolate"})
+GP_COLOR_BRUSH_TYPES = frozenset({'DRAW', 'FILL'})
+COLOR_PICKER_TYPES = frozenset({"CIRCLE_HSV", "CIRCLE_HSL", "SQUARE_SV", "SQUARE_HS", "SQUARE_HV"})
+# (operator idname, use user keyconfig, label) rows of the brush tooltips
+# popover. Every row is an idname lookup, so none has to scan keymap items
+# by name in Python.
+BRUSH_TOOLTIP_SHORTCUTS = (
+    ("paint_system.toggle_brush_erase_alpha", False, "Toggle Erase Alpha"),
+    ("paint_system.color_sample", False, "Eyedropper"),
+    # ("object.transfer_mode", False, "Switch Object"),
+    ("wm.radial_control", True, "Scale Brush Size"),
+)
 
 def nodetree_operator(layout: UILayout, nodetree: NodeTree, text="", icon='ADD'):
     op = layout.operator("node.add_node", text=text, icon=icon)
@@ -41,15 +65,10 @@ class MAT_PT_BrushTooltips(Panel):
         layout = self.layout
         # split = layout.split(factor=0.1)
         col = layout.column()
-        kmi = find_keymap("paint_system.toggle_brush_erase_alpha")
-        self.draw_shortcut(col, kmi, "Toggle Erase Alpha")
-        kmi = find_keymap("paint_system.color_sample")
-        self.draw_shortcut(col, kmi, "Eyedropper")
-        # kmi = find_keymap("object.transfer_mode")
-        # self.draw_shortcut(col, kmi, "Switch Object")
-        kmi = find_keymap_by_name("Radial Control")
-        if kmi:
-            self.draw_shortcut(col, kmi, "Scale Brush Size")
+        for idname, use_user_keyconfig, text in BRUSH_TOOLTIP_SHORTCUTS:
+            kmi = find_keymap(idname, use_user_keyconfig)
+            if kmi:
+                self.draw_shortcut(col, kmi, text)
         # col.label(text="Scale Brush Size", icon='EVENT_F')
         layout.separator()
         layout.operator('paint_system.open_paint_system_preferences', text="Preferences", icon='PREFERENCES')
@@ -60,7 +79,25 @@ class MAT_PT_BrushTooltips(Panel):
 
 def poll_brush_settings(context: Context):
     mode = UnifiedPaintPanel.get_brush_mode(context)
-    return mode in ['PAINT_TEXTURE', 'PAINT_GREASE_PENCIL', 'VERTEX_GREASE_PENCIL', 'WEIGHT_GREASE_PENCIL', 'SCULPT_GREASE_PENCIL']
+    return mode in BRUSH_SETTINGS_MODES
+
+# Cached (brush count, has Paint System brushes). Adding or deleting brushes
+# changes the count, so only file loads need explicit invalidation.
+_ps_brushes_cache: tuple[int, bool] | None = None
+
+def invalidate_ps_brushes_cache():
+    """Forget whether Paint System preset brushes are present."""
+    global _ps_brushes_cache
+    _ps_brushes_cache = None
+
+def has_ps_brushes() -> bool:
+    """Whether the Paint System preset brushes have been added to this file."""
+    global _ps_brushes_cache
+    brushes = bpy.data.brushes
+    brush_count = len(brushes)
+    if _ps_brushes_cache is None or _ps_brushes_cache[0] != brush_count:
+        _ps_brushes_cache = (brush_count, any(brush.name.startswith("PS_") for brush in brushes))
+    return _ps_brushes_cache[1]
 
 def draw_brush_settings(layout: UILayout, context: Context):
     layout.use_property_split = False
@@ -68,19 +105,14 @@ def draw_brush_settings(layout: UILayout, context: Context):
     settings = UnifiedPaintPanel.paint_settings(context)
     brush = settings.brush
     # Check blender version
-    if not is_newer_than(4, 3):
+    if not BL_GE_4_3:
         layout.template_ID_preview(settings, "brush",
                                     new="brush.add", rows=3, cols=8, hide_buttons=False)
     box = layout.box()
     col = box.column(align=True)
     brush_settings(col, context, brush, popover=False)
     
-    brush_imported = False
-    for brush in bpy.data.brushes:
-        if brush.name.startswith("PS_"):
-            brush_imported = True
-            break
-    if not brush_imported:
+    if not has_ps_brushes():
         layout.operator("paint_system.add_preset_brushes",
                         text="Add Preset Brushes", icon="IMPORT")
     
@@ -93,8 +125,7 @@ def draw_brush_settings(layout: UILayout, context: Context):
         
         panel.prop(image_paint, "use_normal_falloff", text="Normal Falloff")
         col = panel.column(align=True)
-        col.use_property_split = True
-        col.use_property_decorate = False
+        use_property_split_layout(col)
         col.prop(image_paint, "normal_angle", text="Angle")
 
 class MAT_PT_Brush(PSContextMixin, Panel, UnifiedPaintPanel):
@@ -121,7 +152,7 @@ class MAT_PT_Brush(PSContextMixin, Panel, UnifiedPaintPanel):
             layout.popover(
                 panel="MAT_PT_BrushTooltips",
                 text='',
-                icon='INFO_LARGE' if is_newer_than(4,3) else 'INFO'
+                icon=INFO_ICON
             )
     #     settings = self.paint_settings(context)
     #     brush = settings.brush
@@ -157,8 +188,9 @@ class MAT_PT_BrushColorSettings(PSContextMixin, Panel):
         layout.prop(ps_ctx.ps_settings, "show_hex_color", text="Show Hex Color")
         layout.prop(ps_ctx.ps_settings, "show_more_color_picker_settings", text="Show HSV Sliders")
 
-def poll_brush_color_settings(context: Context):
-    ps_ctx = PSContextMixin.parse_context(context)
+def poll_brush_color_settings(context: Context, ps_ctx: PSContext | None = None):
+    if ps_ctx is None:
+        ps_ctx = parse_ui_context(context)
     settings = UnifiedPaintPanel.paint_settings(context)
     if not settings:
         return False
@@ -171,84 +203,91 @@ def poll_brush_color_settings(context: Context):
             capabilities = brush.image_paint_capabilities
             return capabilities.has_color
     elif ps_ctx.ps_object.type == 'GREASEPENCIL':
-        from bl_ui.space_toolsystem_common import ToolSelectPanelHelper
         tool = ToolSelectPanelHelper.tool_active_from_context(context)
-        if is_newer_than(5,0):
+        if BL_GE_5_0:
             gpencil_brush_type = brush.gpencil_brush_type
         else:
             gpencil_brush_type = brush.gpencil_tool
-        if tool and tool.idname in {"builtin.cutter", "builtin.eyedropper", "builtin.interpolate"}:
+        if tool and tool.idname in GP_NO_COLOR_TOOLS:
             return False
         if gpencil_brush_type == 'TINT':
             return True
-        if gpencil_brush_type not in {'DRAW', 'FILL'}:
+        if gpencil_brush_type not in GP_COLOR_BRUSH_TYPES:
             return False
         return True
     return False
 
-def draw_brush_color_settings(layout: UILayout, context: Context):
-    ps_ctx = PSContextMixin.parse_context(context)
+@lru_cache(maxsize=64)
+def truncate_material_name(name: str, maxw: int = 25) -> str:
+    """Shorten *name* for the grease pencil material popover label."""
+    if len(name) > maxw:
+        return name[:maxw - 5] + '..' + name[-3:]
+    return name
+
+def draw_brush_color_settings(layout: UILayout, context: Context, ps_ctx: PSContext | None = None):
+    if ps_ctx is None:
+        ps_ctx = parse_ui_context(context)
+    ps_object = ps_ctx.ps_object
+    ps_object_type = ps_object.type
+    if ps_object_type not in {'MESH', 'GREASEPENCIL'}:
+        return
+    ps_settings = ps_ctx.ps_settings
+    ps_scene_data = ps_ctx.ps_scene_data
     col = layout.column()
     settings = UnifiedPaintPanel.paint_settings(context)
     brush = settings.brush
-    if ps_ctx.ps_object.type == 'MESH':
-        prop_owner = get_unified_settings(context, "use_unified_color")
+    if ps_object_type == 'MESH':
         row = col.row()
-        row.scale_y = ps_ctx.ps_settings.color_picker_scale
+        row.scale_y = ps_settings.color_picker_scale
         UnifiedPaintPanel.prop_unified_color_picker(row, context, brush, "color", value_slider=True)
-        if ps_ctx.ps_settings.show_more_color_picker_settings:
+        if ps_settings.show_more_color_picker_settings:
             if not context.preferences.view.color_picker_type == "SQUARE_SV":
-                col.prop(ps_ctx.ps_scene_data, "hue", text="Hue")
-            col.prop(ps_ctx.ps_scene_data, "saturation", text="Saturation")
-            col.prop(ps_ctx.ps_scene_data, "value", text="Value")
-        if ps_ctx.ps_settings.show_hex_color:
+                col.prop(ps_scene_data, "hue", text="Hue")
+            col.prop(ps_scene_data, "saturation", text="Saturation")
+            col.prop(ps_scene_data, "value", text="Value")
+        if ps_settings.show_hex_color:
             row = col.row()
-            row.prop(ps_ctx.ps_scene_data, "hex_color", text="Hex")
-        # Bforartists/Blender variants may not expose color_jitter_panel; fail gracefully
+            row.prop(ps_scene_data, "hex_color", text="Hex")
         box = col.box()
-        try:
-            from bl_ui.properties_paint_common import color_jitter_panel
+        if color_jitter_panel is not None:
             color_jitter_panel(box, context, brush)
-        except Exception:
-            pass
-        try:
-            header, panel = box.panel("paintsystem_color_history_palette", default_closed=True)
-            header.label(text="Color History")
-            if panel:
-                if not ps_ctx.ps_scene_data.color_history_palette:
-                    panel.label(text="No color history yet")
-                else:
-                    panel.template_palette(ps_ctx.ps_scene_data, "color_history_palette", color=True)
-            header, panel = box.panel("paintsystem_color_palette", default_closed=True)
-            header.label(text="Color Palette")
+        header, panel = box.panel("paintsystem_color_history_palette", default_closed=True)
+        header.label(text="Color History")
+        if panel:
+            if not ps_scene_data.color_history_palette:
+                panel.label(text="No color history yet")
+            else:
+                panel.template_palette(ps_scene_data, "color_history_palette", color=True)
+        header, panel = box.panel("paintsystem_color_palette", default_closed=True)
+        header.label(text="Color Palette")
+        if panel:
             panel.template_ID(settings, "palette", new="palette.new")
-            if panel and settings.palette:
+            if settings.palette:
                 panel.template_palette(settings, "palette", color=True)
-        except Exception:
-            pass
         # draw_color_settings(context, col, brush)
-    if ps_ctx.ps_object.type == 'GREASEPENCIL':
+    elif ps_object_type == 'GREASEPENCIL':
         row = col.row()
         row.prop(settings, "color_mode", expand=True)
         use_unified_paint = (context.object.mode != 'PAINT_GREASE_PENCIL')
-        if hasattr(context.tool_settings, "unified_paint_settings"):
+        if HAS_TOOL_SETTINGS_UNIFIED_PAINT:
             ups = context.tool_settings.unified_paint_settings
             prop_owner = ups if use_unified_paint and ups.use_unified_color else brush
         else:
             prop_owner = brush
         enable_color_picker = settings.color_mode == 'VERTEXCOLOR'
         if not enable_color_picker:
-            ma = ps_ctx.ps_object.active_material
+            ma = ps_object.active_material
             icon_id = 0
             txt_ma = ""
             if ma:
-                ma.id_data.preview_ensure()
-                if ma.id_data.preview:
-                    icon_id = ma.id_data.preview.icon_id
-                    txt_ma = ma.name
-                    maxw = 25
-                    if len(txt_ma) > maxw:
-                        txt_ma = txt_ma[:maxw - 5] + '..' + txt_ma[-3:]
+                # preview_ensure always does a lookup, so only call it when missing
+                preview = ma.preview
+                if preview is None:
+                    ma.preview_ensure()
+                    preview = ma.preview
+                if preview:
+                    icon_id = preview.icon_id
+                    txt_ma = truncate_material_name(ma.name)
             col.popover(
                 panel="TOPBAR_PT_grease_pencil_materials",
                 text=txt_ma,
@@ -260,7 +299,7 @@ def draw_brush_color_settings(layout: UILayout, context: Context):
         row.scale_y = 1.2
         row.prop(context.preferences.view, "color_picker_type", text="")
         row = col.row()
-        row.scale_y = ps_ctx.ps_settings.color_picker_scale
+        row.scale_y = ps_settings.color_picker_scale
         row.template_color_picker(prop_owner, "color", value_slider=True)
 
         sub_row = col.row(align=True)
@@ -320,8 +359,6 @@ class MAT_PT_TexPaintRMBMenu(PSContextMixin, Panel, UnifiedPaintPanel):
         return context.mode == 'PAINT_TEXTURE'
 
     def draw(self, context):
-        from ..preferences import addon_package
-        
         layout = self.layout
         ps_ctx = self.parse_context(context)
         settings = self.paint_settings(context)
@@ -336,17 +373,19 @@ class MAT_PT_TexPaintRMBMenu(PSContextMixin, Panel, UnifiedPaintPanel):
             return
         
         # Get preferences
-        prefs = context.preferences.addons.get(addon_package())
-        show_hsv = prefs.preferences.show_hsv_sliders_rmb if prefs else True
-        show_palette = prefs.preferences.show_active_palette_rmb if prefs else True
-        show_brush_controls = prefs.preferences.show_brush_settings_rmb if prefs else True
-        color_wheel_scale = prefs.preferences.color_picker_scale_rmb if prefs else 1.2
+        addon = context.preferences.addons.get(addon_package())
+        prefs = addon.preferences if addon else None
+        show_hsv = prefs.show_hsv_sliders_rmb if prefs else True
+        show_palette = prefs.show_active_palette_rmb if prefs else True
+        show_brush_controls = prefs.show_brush_settings_rmb if prefs else True
+        color_wheel_scale = prefs.color_picker_scale_rmb if prefs else 1.2
 
         # Guard against invalid picker enum values saved from older versions (e.g. "CIRCLE")
         view = context.preferences.view
-        allowed_picker_types = {"CIRCLE_HSV", "CIRCLE_HSL", "SQUARE_SV", "SQUARE_HS", "SQUARE_HV"}
-        if view.color_picker_type not in allowed_picker_types:
-            view.color_picker_type = "CIRCLE_HSV"
+        color_picker_type = view.color_picker_type
+        if color_picker_type not in COLOR_PICKER_TYPES:
+            color_picker_type = "CIRCLE_HSV"
+            view.color_picker_type = color_picker_type
         
         # Color settings container
         color_box = layout.box()
@@ -372,12 +411,13 @@ class MAT_PT_TexPaintRMBMenu(PSContextMixin, Panel, UnifiedPaintPanel):
         # primary_sample = sample_col.operator("paint_system.color_sample", text="", icon='EYEDROPPER')
 
         # HSV sliders (optional based on preferences)
-        if show_hsv and ps_ctx.ps_scene_data:
+        ps_scene_data = ps_ctx.ps_scene_data
+        if show_hsv and ps_scene_data:
             sub_col = color_col.column(align=True)
-            if not context.preferences.view.color_picker_type == "SQUARE_SV":
-                sub_col.prop(ps_ctx.ps_scene_data, "hue", text="Hue")
-            sub_col.prop(ps_ctx.ps_scene_data, "saturation", text="Saturation")
-            sub_col.prop(ps_ctx.ps_scene_data, "value", text="Value")
+            if color_picker_type != "SQUARE_SV":
+                sub_col.prop(ps_scene_data, "hue", text="Hue")
+            sub_col.prop(ps_scene_data, "saturation", text="Saturation")
+            sub_col.prop(ps_scene_data, "value", text="Value")
 
         # Palette selection and history remain with color settings
         # if show_palette:
@@ -451,26 +491,21 @@ class NODE_PT_PaintSystemShaderEditor(PSContextMixin, Panel):
                 header.label(text=channel.name, icon_value=get_icon_from_channel(channel))
                 if panel:
                     layer_col = panel.column(align=True)
-                    flattened = channel.flattened_unlinked_layers
+                    flattened = channel.flatten_hierarchy()
                     if flattened:
-                        for layer in flattened:
-                            self.draw_layer_row(layer_col, context, layer, channel)
+                        for layer, level in flattened:
+                            self.draw_layer_row(layer_col, context, layer, channel, level)
     
-    def draw_layer_row(self, layout, context, layer, channel):
+    def draw_layer_row(self, layout, context, layer, channel, level):
         """Draw a single layer row with indentation for hierarchy"""
         ps_ctx = self.parse_context(context)
         linked_layer = layer.get_layer_data()
         if not linked_layer:
             return
         
-        level = channel.get_item_level_from_id(layer.id)
         row = layout.row(align=True)
         row.label(icon="BLANK1")
-        for i in range(level):
-            if i == level - 1:
-                row.label(icon_value=get_icon('folder_indent'))
-            else:
-                row.label(icon='BLANK1')
+        draw_layer_indent(row, level)
         row.enabled = linked_layer.opacity > 0 and linked_layer.enabled
         draw_layer_icon(linked_layer, row)
         
@@ -486,12 +521,12 @@ class NODE_PT_PaintSystemShaderEditor(PSContextMixin, Panel):
 
 def draw_paint_system_material(self, context):
     layout = self.layout
-    ps_ctx = PSContextMixin.parse_context(context)
+    ps_ctx = parse_ui_context(context)
     if ps_ctx.ps_mat_data and ps_ctx.ps_mat_data.groups:
         box = layout.box()
         box.label(text=f"Paint System Node Groups:", icon_value=get_icon("sunflower"))
         row = box.row(align=True)
-        scale_content(context, row, 1.3, 1.2)
+        scale_content(context, row, 1.3, 1.2, prefs=ps_ctx.ps_settings)
         row.popover("MAT_PT_PaintSystemGroups", text="", icon="NODETREE")
         row.prop(ps_ctx.active_group, "name", text="")
         row.operator("paint_system.new_group", icon='ADD', text="")
@@ -2,32 +2,39 @@ import bpy
 from bpy.types import UIList, Menu, Context, Image, ImagePreview, Panel, NodeTree
 from bpy.utils import register_classes_factory
 import numpy as np
-import textwrap
 
 from ..custom_icons import get_image_editor_icon
 
 from ..utils.version import is_newer_than
 from .common import (
     PSContextMixin,
+    use_property_split_layout,
     draw_layer_icon,
+    draw_layer_indent,
     is_editor_open,
     line_separator,
     scale_content,
-    icon_parser,
+    LOCKED_ICON,
+    SOLID_COLOR_ICON,
     get_icon,
     get_icon_from_channel,
     check_group_multiuser,
     image_node_settings,
     toggle_paint_mode_ui,
     layer_settings_ui,
+    build_enum_operator_items,
     draw_enum_operator_menu,
     draw_socket_grid,
     get_settings_box,
     draw_layer_sidebar,
     draw_warning_box,
+    get_wrapped_warning,
+    prewarm_image_painted_cache,
 )
 
-from ..utils.nodes import find_node, traverse_connected_nodes, get_material_output
+from ..utils.nodes import find_node, find_node_cached, traverse_connected_nodes, get_material_output
+from ..paintsystem.context import PSContext, parse_ui_context
+from ..paintsystem.graph.common import NORMAL_GEOMETRY_TYPES
 from ..paintsystem.data import (
     GlobalLayer,
     ADJUSTMENT_TYPE_ENUM, 
@@ -36,18 +43,47 @@ from ..paintsystem.data import (
     GEOMETRY_TYPE_ENUM,
     Layer,
     is_layer_linked,
-    sort_actions
+    sort_actions,
+    get_cached_layer_warnings,
 )
 
+GRADIENT_EMPTY_TYPES = frozenset({'LINEAR', 'RADIAL', 'FAKE_LIGHT'})
+TRANSFORM_LAYER_TYPES = frozenset({'IMAGE', 'TEXTURE'})
+NO_TRANSFORM_SETTINGS_COORD_TYPES = frozenset({'AUTO', 'OBJECT', 'CAMERA', 'WINDOW', 'REFLECTION', 'POSITION', 'GENERATED'})
+NODE_GROUP_RESERVED_INPUTS = frozenset({'Color', 'Alpha'})
+LAYER_LIST_MIN_ROWS = 6
+LAYER_LIST_MAX_ROWS = 7
+NOT_CONNECTED_WARNING = (
+    ("Paint System not connected", 'ERROR'),
+    ("to material output!", 'BLANK1'),
+)
+
+# Icon ids drawn by several menus and panels, resolved in register() once the
+# custom icons are loaded
+ICON_IMAGE = None
+ICON_FOLDER = None
+
 if is_newer_than(4,3):
     from bl_ui.properties_data_grease_pencil import (
         GreasePencil_LayerMaskPanel,
         DATA_PT_grease_pencil_onion_skinning,
     )
 
+# Layer list opacity column labels. The column shows one decimal, so the
+# 0-1 range only ever needs these eleven strings.
+OPACITY_LABELS = tuple(f"{tenth / 10:.1f}" for tenth in range(11))
+
+def get_opacity_label(opacity: float) -> str:
+    """One-decimal label for *opacity* without formatting a new string per draw."""
+    tenth = round(opacity * 10)
+    if 0 <= tenth <= 10:
+        return OPACITY_LABELS[tenth]
+    return f"{opacity:.1f}"
 
-def draw_input_sockets(layout, context: Context, only_output: bool = False):
-    ps_ctx = PSContextMixin.parse_context(context)
+
+def draw_input_sockets(layout, context: Context, only_output: bool = False, ps_ctx: PSContext | None = None):
+    if ps_ctx is None:
+        ps_ctx = parse_ui_context(context)
     active_layer = ps_ctx.active_layer
     header, panel = layout.panel("input_sockets_panel", default_closed=True)
     header.label(text="Sockets Settings:", icon_value=get_icon('float_socket'))
@@ -55,6 +91,32 @@ def draw_input_sockets(layout, context: Context, only_output: bool = False):
         row = panel.row(align=True)
         row.label(icon="BLANK1")
         draw_socket_grid(row, active_layer, include_inputs=not only_output)
+# Per-redraw hierarchy snapshot built in MAT_PT_UL_LayerList.filter_items,
+# keyed by channel pointer: {item id: (level, parent enabled)}. Only plain
+# values are stored, so a stale entry never holds a freed layer.
+_layer_list_hierarchy: dict[int, dict[int, tuple[int, bool]]] = {}
+
+def build_layer_list_hierarchy(flattened_hierarchy) -> dict[int, tuple[int, bool]]:
+    """Map each layer id to its level and whether its parent is enabled."""
+    enabled_by_id = {}
+    hierarchy = {}
+    for layer, level in flattened_hierarchy:
+        enabled_by_id[layer.id] = layer.enabled
+        hierarchy[layer.id] = (level, enabled_by_id.get(layer.parent_id, True))
+    return hierarchy
+
+def get_layer_list_hierarchy(channel) -> dict[int, tuple[int, bool]]:
+    """Return the hierarchy snapshot for *channel*, building it if missing."""
+    channel_key = channel.as_pointer()
+    hierarchy = _layer_list_hierarchy.get(channel_key)
+    if hierarchy is None:
+        hierarchy = _layer_list_hierarchy[channel_key] = build_layer_list_hierarchy(channel.flatten_hierarchy())
+    return hierarchy
+
+# Whether a layer list item type defines custom_int, resolved once per type
+# instead of an exception-raising hasattr probe on every row
+_HAS_CUSTOM_INT: dict[type, bool] = {}
+
 class MAT_PT_UL_LayerList(PSContextMixin, UIList):
     def draw_item(self, context: Context, layout: bpy.types.UILayout, data, item, icon, active_data, active_property, index):
         ps_ctx = self.parse_context(context)
@@ -63,25 +125,22 @@ class MAT_PT_UL_LayerList(PSContextMixin, UIList):
             return
         # The UIList passes channel as 'data'
         active_channel = data
-        flattened = active_channel.flattened_layers
-        if index < len(flattened):
-            level = active_channel.get_item_level_from_id(item.id)
+        hierarchy = get_layer_list_hierarchy(active_channel)
+        if index < len(hierarchy):
+            item_id = item.id
+            level, parent_enabled = hierarchy.get(item_id, (-1, True))
             main_row = layout.row(align=True)
-            warnings = item.get_layer_warnings(context)
+            warnings = get_cached_layer_warnings(item, context, ps_ctx)
                 # main_row.label(text="\n".join(warnings), icon='ERROR')
             # Check if parent of the current item is enabled
-            parent_item = active_channel.get_item_by_id(
-                item.parent_id)
-            if parent_item and not parent_item.enabled:
+            if not parent_enabled:
                 main_row.enabled = False
 
+            enabled = linked_item.enabled
+            opacity = linked_item.opacity
             row = main_row.row(align=True)
-            for i in range(level):
-                if i == level - 1:
-                    row.label(icon_value=get_icon('folder_indent'))
-                else:
-                    row.label(icon='BLANK1')
-            row.enabled = linked_item.opacity > 0 and linked_item.enabled
+            draw_layer_indent(row, level)
+            row.enabled = opacity > 0 and enabled
             if linked_item.is_clip:
                 clipping_row = row.row()
                 clipping_row.scale_x = 0.7
@@ -93,18 +152,18 @@ class MAT_PT_UL_LayerList(PSContextMixin, UIList):
             row = main_row.row(align=True)
             row.alignment = 'RIGHT'
             if linked_item.lock_layer:
-                row.label(icon=icon_parser('VIEW_LOCKED', 'LOCKED'))
+                row.label(icon=LOCKED_ICON)
             if len(linked_item.actions) > 0:
                 row.label(icon="KEYTYPE_KEYFRAME_VEC")
             if is_layer_linked(linked_item):
                 row.label(icon="LINKED")
             if warnings:
                 op = row.operator("paint_system.show_layer_warnings", text="", icon_value=get_icon('error'), emboss=False)
-                op.layer_id = item.id
+                op.layer_id = item_id
             if ps_ctx.ps_settings.show_opacity_in_layer_list:
-                row.label(text=f"{linked_item.opacity:.1f}")
+                row.label(text=get_opacity_label(opacity))
             row.prop(linked_item, "enabled", text="",
-                     icon="HIDE_OFF" if linked_item.enabled else "HIDE_ON", emboss=False)
+                     icon="HIDE_OFF" if enabled else "HIDE_ON", emboss=False)
             self.draw_custom_properties(row, linked_item)
 
     def filter_items(self, context, data, propname):
@@ -119,26 +178,41 @@ class MAT_PT_UL_LayerList(PSContextMixin, UIList):
         # If you do not make filtering and/or ordering, return empty list(s) (this will be more efficient than
         # returning full lists doing nothing!).
         layers = getattr(data, propname).values()
-        flattened_layers = data.flattened_unlinked_layers
+        flattened_hierarchy = data.flatten_hierarchy()
 
         # Default return values.
         flt_flags = []
         flt_neworder = []
 
+        # Map item ids to their display order, and collect the items hidden
+        # by a collapsed ancestor in one pass (parents come before children)
+        order_map = {}
+        hidden_ids = set()
+        expanded_ids = {layer.id for layer, _ in flattened_hierarchy if layer.is_expanded}
+        for order, (layer, level) in enumerate(flattened_hierarchy):
+            order_map[layer.id] = order
+            parent_id = layer.parent_id
+            if parent_id != -1 and (parent_id in hidden_ids or parent_id not in expanded_ids):
+                hidden_ids.add(layer.id)
+
         # Filtering by name
         flt_flags = [self.bitflag_filter_item] * len(layers)
         for idx, layer in enumerate(layers):
-            flt_neworder.append(flattened_layers.index(layer))
-            while layer.parent_id != -1:
-                layer = data.get_item_by_id(layer.parent_id)
-                if layer and not layer.is_expanded:
-                    flt_flags[idx] &= ~self.bitflag_filter_item
-                    break
+            flt_neworder.append(order_map[layer.id])
+            if layer.id in hidden_ids:
+                flt_flags[idx] &= ~self.bitflag_filter_item
 
+        # filter_items runs before draw_item on every redraw, so draw_item can
+        # reuse this instead of scanning for levels and parents per row
+        _layer_list_hierarchy[data.as_pointer()] = build_layer_list_hierarchy(flattened_hierarchy)
         return flt_flags, flt_neworder
 
     def draw_custom_properties(self, layout, item):
-        if hasattr(item, 'custom_int'):
+        item_type = type(item)
+        has_custom_int = _HAS_CUSTOM_INT.get(item_type)
+        if has_custom_int is None:
+            has_custom_int = _HAS_CUSTOM_INT[item_type] = hasattr(item, 'custom_int')
+        if has_custom_int:
             layout.label(text=str(item.order))
 
 
@@ -156,7 +230,7 @@ class MAT_MT_PaintSystemMergeAndExport(PSContextMixin, Menu):
             layout.separator()
         layout.label(text="Bake")
         layout.operator("paint_system.bake_channel", text="Bake Active Channel", icon_value=get_icon_from_channel(active_channel))
-        layout.operator("paint_system.bake_channel", text=f"Bake Active Channel as Layer", icon_value=get_icon("image")).as_layer = True
+        layout.operator("paint_system.bake_channel", text=f"Bake Active Channel as Layer", icon_value=ICON_IMAGE).as_layer = True
         if not ps_ctx.ps_settings.use_legacy_ui:
             layout.operator("paint_system.bake_all_channels", text=f"Bake All Channels", icon_value=get_icon('channels'))
         layout.separator()
@@ -168,15 +242,19 @@ class MAT_MT_PaintSystemMergeAndExport(PSContextMixin, Menu):
             layout.operator("paint_system.export_all_images", text="Export All Channels", icon='EXPORT')
 
 
-def draw_layer_settings(layout, context):
-    ps_ctx = PSContextMixin.parse_context(context)
+def draw_layer_settings(layout, context, ps_ctx: PSContext | None = None):
+    if ps_ctx is None:
+        ps_ctx = parse_ui_context(context)
     active_layer = ps_ctx.active_layer
-    layout.enabled = not active_layer.lock_layer
     if ps_ctx.ps_settings.use_legacy_ui:
         box = layout.box()
-        layer_settings_ui(box, context)
+        layer_settings_ui(box, context, ps_ctx)
     else:
         box = None
+    if active_layer.lock_layer:
+        # Locked settings would only be drawn greyed out, so skip building them
+        layout.label(text="Layer Locked", icon=LOCKED_ICON)
+        return
     match active_layer.type:
         case 'IMAGE':
             pass
@@ -185,7 +263,7 @@ def draw_layer_settings(layout, context):
             # row = col.row(align=True)
             # scale_content(context, row, 1.2, 1.2)
             # if not active_layer.external_image:
-            #     icon_value = get_image_editor_icon(context.preferences.filepaths.image_editor) or get_icon('image')
+            #     icon_value = get_image_editor_icon(context.preferences.filepaths.image_editor) or ICON_IMAGE
             #     row.operator("paint_system.quick_edit", text="Edit in Image Editor", icon_value=icon_value)
             # else:
             #     if active_layer.edit_external_mode == 'IMAGE_EDIT':
@@ -205,19 +283,17 @@ def draw_layer_settings(layout, context):
             box = get_settings_box(layout, ps_ctx.ps_settings.use_legacy_ui, box)
             col = box.column()
             node_group = active_layer.source_node
-            inputs = [i for i in node_group.inputs if not i.is_linked and i.name not in (
-                'Color', 'Alpha')]
+            inputs = [i for i in node_group.inputs if not i.is_linked and i.name not in NODE_GROUP_RESERVED_INPUTS]
             if inputs:
                 col.label(text="Node Group Settings:", icon='NODETREE')
                 for socket in inputs:
                     col.prop(socket, "default_value",
                             text=socket.name)
         case 'GRADIENT':
-            if active_layer.gradient_type in ('LINEAR', 'RADIAL', 'FAKE_LIGHT'):
+            if active_layer.gradient_type in GRADIENT_EMPTY_TYPES:
                 box = get_settings_box(layout, ps_ctx.ps_settings.use_legacy_ui, box)
                 col = box.column()
-                col.use_property_split = True
-                col.use_property_decorate = False
+                use_property_split_layout(col)
                 if active_layer.empty_object and active_layer.empty_object.name in context.view_layer.objects:
                     empty_col = col.column(align=True)
                     empty_col.operator("paint_system.select_empty", text="Select Gradient Empty" if active_layer.gradient_type != 'FAKE_LIGHT' else "Select Light Empty", icon='OBJECT_ORIGIN')
@@ -249,8 +325,7 @@ def draw_layer_settings(layout, context):
                 col.prop(
                     random_node.inputs[1], "default_value", text="Random Seed")
                 col = col.column()
-                col.use_property_split = True
-                col.use_property_decorate = False
+                use_property_split_layout(col)
                 col.prop(
                     hue_saturation_value.inputs['Color'], "default_value", text="Base Color")
                 col.prop(
@@ -274,13 +349,12 @@ def draw_layer_settings(layout, context):
                 col = box.column()
                 col.label(text="Material Settings:", icon='MESH_DATA')
                 col.prop(mat, "use_backface_culling", text="Backface Culling", icon='CHECKBOX_HLT' if mat.use_backface_culling else 'CHECKBOX_DEHLT')
-            elif geometry_type in ['WORLD_NORMAL', 'WORLD_TRUE_NORMAL', 'OBJECT_NORMAL']:
+            elif geometry_type in NORMAL_GEOMETRY_TYPES:
                 col.prop(active_layer, "normalize_normal", text="Normalize Normal", icon='MESH_DATA')
             elif geometry_type == 'AMBIENT_OCCLUSION':
                 geo_node = active_layer.find_node("geometry")
                 if geo_node:
-                    col.use_property_split = True
-                    col.use_property_decorate = False
+                    use_property_split_layout(col)
                     col.prop(geo_node, "samples", text="Samples")
                     col.prop(geo_node, "inside", text="Inside")
                     col.prop(geo_node, "only_local", text="Only Local")
@@ -294,8 +368,7 @@ def draw_layer_settings(layout, context):
         header, panel = layout.panel("node_group_panel")
         header.label(text="Sockets Settings:")
         if panel:
-            panel.use_property_split = True
-            panel.use_property_decorate = False
+            use_property_split_layout(panel)
             col = panel.column()
             draw_socket_grid(col, active_layer, include_inputs=True)
     
@@ -303,14 +376,14 @@ def draw_layer_settings(layout, context):
     # Image Settings
     if active_layer.type == 'IMAGE':
         header, panel = layout.panel("image_settings_panel", default_closed=True)
-        header.label(text="Image", icon_value=get_icon('image'))
+        header.label(text="Image", icon_value=ICON_IMAGE)
         if panel:
             box = panel.box()
             col = box.column()
             row = col.row(align=True)
-            scale_content(context, row, 1.1, 1.1)
+            scale_content(context, row, 1.1, 1.1, prefs=ps_ctx.ps_settings)
             if not active_layer.external_image:
-                icon_value = get_image_editor_icon(context.preferences.filepaths.image_editor) or get_icon('image')
+                icon_value = get_image_editor_icon(context.preferences.filepaths.image_editor) or ICON_IMAGE
                 row.operator("paint_system.quick_edit", text="Edit in Image Editor", icon_value=icon_value)
             else:
                 if active_layer.edit_external_mode == 'IMAGE_EDIT':
@@ -324,7 +397,7 @@ def draw_layer_settings(layout, context):
             panel = image_node_settings(col, image_node, active_layer, "image", simple_ui=True)
             if panel:
                 line_separator(col)
-            draw_input_sockets(col, context, only_output=True)
+            draw_input_sockets(col, context, only_output=True, ps_ctx=ps_ctx)
             row = col.row(align=True)
             row.label(icon="BLANK1")
             row.prop(active_layer, "correct_image_aspect", text="Correct Aspect", toggle=1, icon='CHECKBOX_HLT' if active_layer.correct_image_aspect else 'CHECKBOX_DEHLT')
@@ -333,23 +406,24 @@ def draw_layer_settings(layout, context):
         row.operator("wm.call_menu", text="Filters").name = "MAT_MT_ImageFilterMenu"
     if active_layer.type == 'GRADIENT':
         gradient_node = active_layer.source_node
-        map_range_node = active_layer.find_node("map_range")
-        if gradient_node and map_range_node:
+        if gradient_node:
             header, panel = layout.panel("gradient_node_settings_panel", default_closed=True)
             header.label(text="Gradient" if active_layer.gradient_type != 'FAKE_LIGHT' else "Light Gradient", icon='COLOR')
             if panel:
                 box = panel.box()
                 box.template_node_inputs(gradient_node)
-                header, panel = box.panel("map_range_node_settings_panel", default_closed=True)
-                header.label(text="Map Range:", icon='SHADERFX')
-                if panel:
-                    panel.use_property_split = True
-                    panel.use_property_decorate = False
-                    panel.prop(map_range_node, "interpolation_type", text="Interpolation")
-                    if map_range_node.interpolation_type in ('STEPPED'):
-                        panel.prop(map_range_node.inputs[5], "default_value", text="Steps")
-                    panel.prop(map_range_node.inputs[1], "default_value", text="Start Distance")
-                    panel.prop(map_range_node.inputs[2], "default_value", text="End Distance")
+                # Only looked up once the panel is open
+                map_range_node = active_layer.find_node("map_range")
+                if map_range_node:
+                    header, panel = box.panel("map_range_node_settings_panel", default_closed=True)
+                    header.label(text="Map Range:", icon='SHADERFX')
+                    if panel:
+                        use_property_split_layout(panel)
+                        panel.prop(map_range_node, "interpolation_type", text="Interpolation")
+                        if map_range_node.interpolation_type == 'STEPPED':
+                            panel.prop(map_range_node.inputs[5], "default_value", text="Steps")
+                        panel.prop(map_range_node.inputs[1], "default_value", text="Start Distance")
+                        panel.prop(map_range_node.inputs[2], "default_value", text="End Distance")
     if active_layer.type == 'TEXTURE':
         header, panel = layout.panel("texture_node_settings_panel", default_closed=True)
         header.label(text="Texture", icon='TEXTURE')
@@ -358,7 +432,7 @@ def draw_layer_settings(layout, context):
             col = box.column()
             col.use_property_decorate = False
             col.use_property_split = True
-            draw_input_sockets(col, context, only_output=True)
+            draw_input_sockets(col, context, only_output=True, ps_ctx=ps_ctx)
             col.prop(active_layer, "texture_type", text="Texture Type")
             texture_node = active_layer.source_node
             if texture_node:
@@ -376,18 +450,17 @@ def draw_layer_settings(layout, context):
                 col.label(text="Attribute Settings:", icon='MESH_DATA')
                 col.template_node_inputs(attribute_node)
     # Transform Settings
-    if active_layer.type in ('IMAGE', 'TEXTURE'):
+    if active_layer.type in TRANSFORM_LAYER_TYPES:
         header, transform_panel = layout.panel("layer_transform_settings_panel", default_closed=True)
         header.label(text="Transform", icon_value=get_icon('transform'))
         row = header.row(align=True)
         row.prop(active_layer, "coord_type", text="")
-        if ps_ctx.active_layer.type == "IMAGE" and ps_ctx.active_layer.image:
+        if active_layer.type == "IMAGE" and active_layer.image:
             row.operator("paint_system.transfer_image_layer_uv", text="", icon='UV_DATA')
         if transform_panel:
-            transform_panel.use_property_split = True
-            transform_panel.use_property_decorate = False
+            use_property_split_layout(transform_panel)
             box = transform_panel.box()
-            if active_layer.coord_type not in {'AUTO', 'OBJECT', 'CAMERA', 'WINDOW', 'REFLECTION', 'POSITION', 'GENERATED'}:
+            if active_layer.coord_type not in NO_TRANSFORM_SETTINGS_COORD_TYPES:
                 col = box.column()
                 if active_layer.coord_type == 'UV':
                     col.prop_search(active_layer, "uv_map_name", text="UV Map",
@@ -502,9 +575,12 @@ class MAT_PT_Layers(PSContextMixin, Panel):
     @classmethod
     def poll(cls, context):
         ps_ctx = cls.parse_context(context)
-        if ps_ctx.active_group and check_group_multiuser(ps_ctx.active_group.node_tree):
+        ps_object = ps_ctx.ps_object
+        # Cheap context checks first, the multiuser scan last
+        if not ps_object or (ps_ctx.active_channel is None and ps_object.type != 'GREASEPENCIL'):
             return False
-        return ps_ctx.ps_object and (ps_ctx.active_channel is not None or ps_ctx.ps_object.type == 'GREASEPENCIL')
+        active_group = ps_ctx.active_group
+        return not (active_group and check_group_multiuser(active_group.node_tree))
     
     def draw_header(self, context):
         layout = self.layout
@@ -539,7 +615,7 @@ class MAT_PT_Layers(PSContextMixin, Panel):
             is_layer_active = layers.active is not None
             is_group_active = grease_pencil.layer_groups.active is not None
             row = box.row()
-            scale_content(context, row, scale_x=1, scale_y=1.2)
+            scale_content(context, row, scale_x=1, scale_y=1.2, prefs=ps_ctx.ps_settings)
             row.template_grease_pencil_layer_tree()
             col = row.column()
             sub = col.column(align=True)
@@ -573,20 +649,19 @@ class MAT_PT_Layers(PSContextMixin, Panel):
                     row = col.row(align=True)
                     row.scale_y = 1.2
                     row.scale_x = 1.2
-                    scale_content(context, row, 1.7, 1.5)
+                    scale_content(context, row, 1.7, 1.5, prefs=ps_ctx.ps_settings)
                     options_row = row.row(align=True)
                     options_row.enabled = not active_layer.lock
                     options_row.prop(active_layer, "use_masks", text="")
                     # options_row.prop(active_layer, "use_lights", text="", icon='LIGHT')
                     # options_row.prop(active_layer, "use_onion_skinning", text="")
-                    lock_row = row.row(align=True)
-                    lock_row.prop(active_layer, "lock", text="")
+                    row.prop(active_layer, "lock", text="")
                     blend_row = row.row(align=True)
                     blend_row.enabled = not active_layer.lock
                     blend_row.prop(active_layer, "blend_mode", text="")
                     opacity_row = col.row(align=True)
                     opacity_row.enabled = not active_layer.lock
-                    scale_content(context, opacity_row, 1.7, 1.5)
+                    scale_content(context, opacity_row, 1.7, 1.5, prefs=ps_ctx.ps_settings)
                     opacity_row.prop(active_layer, "opacity")
                     
                     col = box.column()
@@ -607,7 +682,7 @@ class MAT_PT_Layers(PSContextMixin, Panel):
                     box = main_row.box()
                     if ps_ctx.active_layer and ps_ctx.active_layer.node_tree:
                         settings_box = box.box()
-                        layer_settings_ui(settings_box, context)
+                        layer_settings_ui(settings_box, context, ps_ctx)
                 else:
                     box = layout.box()
         
@@ -617,21 +692,16 @@ class MAT_PT_Layers(PSContextMixin, Panel):
             # contains_mat_setup = any([node.type == 'GROUP' and node.node_tree ==
             #                           active_channel.node_tree for node in mat.node_tree.nodes])
 
-            layers = active_channel.layers
-
             # Toggle paint mode (switch between object and texture paint mode)
-            group_node = find_node(mat.node_tree, {
+            group_node = find_node_cached(mat.node_tree, {
                                 'bl_idname': 'ShaderNodeGroup', 'node_tree': active_group.node_tree})
             if not group_node:
-                warning_col = draw_warning_box(box, [
-                    ("Paint System not connected", 'ERROR'),
-                    ("to material output!", 'BLANK1'),
-                ])
+                warning_col = draw_warning_box(box, NOT_CONNECTED_WARNING)
                 if not is_editor_open(context, 'NODE_EDITOR'):
                     warning_col.operator("paint_system.focus_ps_node", text="Open Shader Editor", icon="NODETREE")
 
             if active_channel.use_bake_image:
-                image_node = find_node(active_channel.node_tree, {'bl_idname': 'ShaderNodeTexImage', 'image': active_channel.bake_image})
+                image_node = find_node_cached(active_channel.node_tree, {'bl_idname': 'ShaderNodeTexImage', 'image': active_channel.bake_image})
                 bake_box = layout.box()
                 col = bake_box.column()
                 # col.label(text="Baked Image", icon="TEXTURE_DATA")
@@ -641,12 +711,13 @@ class MAT_PT_Layers(PSContextMixin, Panel):
                 return
 
 
+            prewarm_image_painted_cache(active_channel)
             row = box.row()
             layers_col = row.column()
-            scale_content(context, row, scale_x=1, scale_y=1.5)
+            scale_content(context, row, scale_x=1, scale_y=1.5, prefs=ps_ctx.ps_settings)
             layers_col.template_list(
                 "MAT_PT_UL_LayerList", "", active_channel, "layers", active_channel, "active_index",
-                rows=min(max(6, len(layers)), 7)
+                rows=LAYER_LIST_MAX_ROWS if len(active_channel.layers) > LAYER_LIST_MIN_ROWS else LAYER_LIST_MIN_ROWS
             )
 
             col = row.column(align=True)
@@ -656,27 +727,24 @@ class MAT_PT_Layers(PSContextMixin, Panel):
             if not active_layer:
                 return
                 # Settings
-            warnings = active_layer.get_layer_warnings(context)
+            warnings = get_cached_layer_warnings(active_layer, context, ps_ctx)
             if warnings:
                 warnings_box = layout.box()
                 warnings_box.alert = True
                 warnings_col = warnings_box.column(align=True)
-                wrapp = textwrap.TextWrapper(width=32) #50 = maximum length
                 for warning in warnings:
-                    # Split warning into chunks of 6 words
-                    wList = wrapp.wrap(text=warning)
-                    for i, chunk in enumerate(wList):
+                    for i, chunk in enumerate(get_wrapped_warning(warning)):
                         warnings_col.label(text=chunk, icon='ERROR' if not i else 'BLANK1')
             
             header, panel = layout.panel("layer_settings_panel")
             header.label(text="Layer Settings")
             if panel:
-                draw_layer_settings(panel, context)
+                draw_layer_settings(panel, context, ps_ctx)
 
 
 def get_image(context) -> bpy.types.Image:
     image = None
-    ps_ctx = PSContextMixin.parse_context(context)
+    ps_ctx = parse_ui_context(context)
     if ps_ctx.active_channel and  ps_ctx.active_channel.use_bake_image:
         image = ps_ctx.active_channel.bake_image
     elif ps_ctx.active_layer and ps_ctx.active_layer.image:
@@ -735,7 +803,7 @@ class MAT_MT_LayerMenu(PSContextMixin, Menu):
             layout.operator(
                 "paint_system.convert_to_image_layer",
                 text="Convert to Image Layer",
-                icon_value=get_icon('image')
+                icon_value=ICON_IMAGE
             )
         
         if ps_ctx.unlinked_layer and is_layer_linked(ps_ctx.unlinked_layer):
@@ -785,13 +853,20 @@ class MAT_MT_LayerMenu(PSContextMixin, Menu):
         )
 
 
+# Add layer menu entries, built once since the type enums are static
+GRADIENT_MENU_ITEMS = build_enum_operator_items(GRADIENT_TYPE_ENUM, 'COLOR', skip_types={'FAKE_LIGHT'})
+ADJUSTMENT_MENU_ITEMS = build_enum_operator_items(ADJUSTMENT_TYPE_ENUM, 'SHADERFX')
+TEXTURE_MENU_ITEMS = build_enum_operator_items(TEXTURE_TYPE_ENUM, 'TEXTURE')
+GEOMETRY_MENU_ITEMS = build_enum_operator_items(GEOMETRY_TYPE_ENUM, 'MESH_DATA')
+
+
 class MAT_MT_AddImageLayerMenu(Menu):
     bl_label = "Add Image"
     bl_idname = "MAT_MT_AddImageLayerMenu"
     
     def draw(self, context):
         layout = self.layout
-        layout.operator("paint_system.new_image_layer", text="New Image Layer", icon_value=get_icon('image')).image_add_type = 'NEW'
+        layout.operator("paint_system.new_image_layer", text="New Image Layer", icon_value=ICON_IMAGE).image_add_type = 'NEW'
         layout.operator("paint_system.new_image_layer", text="Import Image Layer").image_add_type = 'IMPORT'
         layout.operator("paint_system.new_image_layer", text="Use Existing Image Layer").image_add_type = 'EXISTING'
 
@@ -802,9 +877,8 @@ class MAT_MT_AddGradientLayerMenu(Menu):
     
     def draw(self, context):
         draw_enum_operator_menu(
-            self.layout, GRADIENT_TYPE_ENUM,
-            "paint_system.new_gradient_layer", "gradient_type", 'COLOR',
-            skip_types={'FAKE_LIGHT'},
+            self.layout, GRADIENT_MENU_ITEMS,
+            "paint_system.new_gradient_layer", "gradient_type",
         )
 
 
@@ -814,8 +888,8 @@ class MAT_MT_AddAdjustmentLayerMenu(Menu):
     
     def draw(self, context):
         draw_enum_operator_menu(
-            self.layout, ADJUSTMENT_TYPE_ENUM,
-            "paint_system.new_adjustment_layer", "adjustment_type", 'SHADERFX',
+            self.layout, ADJUSTMENT_MENU_ITEMS,
+            "paint_system.new_adjustment_layer", "adjustment_type",
         )
 
 
@@ -825,8 +899,8 @@ class MAT_MT_AddTextureLayerMenu(Menu):
     
     def draw(self, context):
         draw_enum_operator_menu(
-            self.layout, TEXTURE_TYPE_ENUM,
-            "paint_system.new_texture_layer", "texture_type", 'TEXTURE',
+            self.layout, TEXTURE_MENU_ITEMS,
+            "paint_system.new_texture_layer", "texture_type",
         )
 
 
@@ -836,8 +910,8 @@ class MAT_MT_AddGeometryLayerMenu(Menu):
     
     def draw(self, context):
         draw_enum_operator_menu(
-            self.layout, GEOMETRY_TYPE_ENUM,
-            "paint_system.new_geometry_layer", "geometry_type", 'MESH_DATA',
+            self.layout, GEOMETRY_MENU_ITEMS,
+            "paint_system.new_geometry_layer", "geometry_type",
         )
 
 class MAT_MT_AddLayerMenu(Menu):
@@ -861,12 +935,12 @@ class MAT_MT_AddLayerMenu(Menu):
         layout.operator_context = 'INVOKE_REGION_WIN'
         
         col.operator("paint_system.new_folder_layer",
-                     icon_value=get_icon('folder'), text="Folder")
+                     icon_value=ICON_FOLDER, text="Folder")
         col.separator()
         # col.label(text="Basic:")
         col.operator("paint_system.new_solid_color_layer", text="Solid Color",
-                     icon=icon_parser('STRIP_COLOR_03', "SEQUENCE_COLOR_03"))
-        col.menu("MAT_MT_AddImageLayerMenu", text="Image", icon_value=get_icon('image'))
+                     icon=SOLID_COLOR_ICON)
+        col.menu("MAT_MT_AddImageLayerMenu", text="Image", icon_value=ICON_IMAGE)
         col.menu("MAT_MT_AddGradientLayerMenu", text="Gradient", icon='COLOR')
         col.menu("MAT_MT_AddTextureLayerMenu", text="Texture", icon='TEXTURE')
         col.menu("MAT_MT_AddAdjustmentLayerMenu", text="Adjustment", icon='SHADERFX')
@@ -911,11 +985,10 @@ class PAINTSYSTEM_UL_Actions(PSContextMixin, UIList):
     
     def filter_items(self, context, data, propname):
         actions = getattr(data, propname).values()
-        flt_flags = [self.bitflag_filter_item] * len(data.actions)
-        flt_neworder = []
-        sorted_actions = sort_actions(context, data)
-        for action in actions:
-            flt_neworder.append(sorted_actions.index(action))
+        flt_flags = [self.bitflag_filter_item] * len(actions)
+        # RNA wrappers are recreated on access, so match actions by pointer
+        sorted_positions = {action.as_pointer(): idx for idx, action in enumerate(sort_actions(context, data))}
+        flt_neworder = [sorted_positions[action.as_pointer()] for action in actions]
         return flt_flags, flt_neworder
 
 
@@ -936,4 +1009,13 @@ classes = (
     MAT_MT_AddMaskMenu,
 )
 
-register, unregister = register_classes_factory(classes)
+_register, _unregister = register_classes_factory(classes)
+
+def register():
+    global ICON_IMAGE, ICON_FOLDER
+    ICON_IMAGE = get_icon('image')
+    ICON_FOLDER = get_icon('folder')
+    _register()
+
+def unregister():
+    _unregister()
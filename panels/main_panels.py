@@ -8,10 +8,9 @@ from bl_ui.properties_paint_common import (
 from .channels_panels import draw_channels_settings_panel, poll_channels_panel, draw_channels_panel
 from .extras_panels import poll_brush_color_settings, draw_brush_color_settings, poll_brush_settings, draw_brush_settings
 
-from ..utils.version import is_newer_than
-
 from .common import (
     PSContextMixin,
+    use_property_split_layout,
     draw_indent,
     get_icon,
     get_icon_from_channel,
@@ -21,9 +20,20 @@ from .common import (
     toggle_paint_mode_ui,
     ensure_invoke_context,
     draw_warning_box,
+    INFO_ICON,
+)
+
+from ..paintsystem.data import get_legacy_material_settings
+
+DUPLICATED_DATA_WARNING = (
+    ("Duplicated Paint System Data", 'ERROR'),
 )
 
-from ..paintsystem.data import LegacyPaintSystemContextParser
+# Custom icon ids drawn on every redraw, resolved once in register()
+ICON_SUNFLOWER = None
+ICON_CHANNEL = None
+ICON_BRUSH = None
+ICON_COLOR = None
 
 class MAT_MT_PaintSystemMaterialSelectMenu(PSContextMixin, Menu):
     bl_label = "Material Select Menu"
@@ -33,14 +43,14 @@ class MAT_MT_PaintSystemMaterialSelectMenu(PSContextMixin, Menu):
         layout = self.layout
         ps_ctx = self.parse_context(context)
         ob = ps_ctx.ps_object
+        active_material_index = ob.active_material_index
         for idx, material_slot in enumerate(ob.material_slots):
-            is_selected = ob.active_material_index == idx
-            mat = material_slot.material is not None
+            mat = material_slot.material
             op = layout.operator(
                 "paint_system.select_material_index",
-                text=material_slot.material.name if mat else "Empty Material",
+                text=mat.name if mat else "Empty Material",
                 icon="MATERIAL" if mat else "MESH_CIRCLE",
-                depress=is_selected,
+                depress=idx == active_material_index,
             )
             op.index = idx
 
@@ -76,7 +86,7 @@ class MAT_PT_PaintSystemGroups(PSContextMixin, Panel):
         ps_ctx = self.parse_context(context)
         layout = self.layout
         layout.label(text="Groups")
-        scale_content(context, layout)
+        scale_content(context, layout, prefs=ps_ctx.ps_settings)
         layout.template_list("MATERIAL_UL_PaintSystemGroups", "", ps_ctx.ps_mat_data, "groups", ps_ctx.ps_mat_data, "active_index")
 
 
@@ -92,22 +102,23 @@ class MAT_PT_PaintSystemMaterialSettings(PSContextMixin, Panel):
         ps_ctx = self.parse_context(context)
         mat = ps_ctx.active_material
         ob = ps_ctx.ps_object
+        ps_settings = ps_ctx.ps_settings
+        ps_mat_data = ps_ctx.ps_mat_data
         layout = self.layout
-        layout.use_property_split = True
-        layout.use_property_decorate = False
-        if not ps_ctx.ps_settings.use_legacy_ui:
+        use_property_split_layout(layout)
+        if not ps_settings.use_legacy_ui:
             row = layout.row(align=True)
-            scale_content(context, row, 1.5, 1.2)
+            scale_content(context, row, 1.5, 1.2, prefs=ps_settings)
             row.menu("MAT_MT_PaintSystemMaterialSelectMenu", text="" if ob.active_material else "Empty Material", icon="MATERIAL" if ob.active_material else "MESH_CIRCLE")
             if mat:
                 row.prop(mat, "name", text="")
         layout.prop(mat, "surface_render_method", text="Render Method")
         layout.prop(mat, "use_backface_culling", text="Backface Culling")
-        if ps_ctx.ps_mat_data and ps_ctx.ps_mat_data.groups:
+        if ps_mat_data and ps_mat_data.groups:
             box = layout.box()
-            box.label(text=f"Paint System Node Groups:", icon_value=get_icon("sunflower"))
+            box.label(text=f"Paint System Node Groups:", icon_value=ICON_SUNFLOWER)
             row = box.row(align=True)
-            scale_content(context, row, 1.3, 1.2)
+            scale_content(context, row, 1.3, 1.2, prefs=ps_settings)
             row.popover("MAT_PT_PaintSystemGroups", text="", icon="NODETREE")
             row.prop(ps_ctx.active_group, "name", text="")
             row.operator("paint_system.new_group", icon='ADD', text="")
@@ -126,14 +137,12 @@ class MAT_PT_PaintSystemMainPanel(PSContextMixin, Panel):
         row = layout.row(align=True)
         if ps_ctx.ps_mat_data is None:
             return
-        groups = ps_ctx.ps_mat_data.groups
-        if ps_ctx.ps_mat_data and groups:
-            if len(groups) > 1:
-                row.popover("MAT_PT_PaintSystemGroups", text="", icon="NODETREE")
-            row.operator("paint_system.new_group", icon='ADD', text="")
+        group_count = len(ps_ctx.ps_mat_data.groups)
+        if group_count > 1:
+            row.popover("MAT_PT_PaintSystemGroups", text="", icon="NODETREE")
+        row.operator("paint_system.new_group", icon='ADD', text="")
+        if group_count:
             row.operator("wm.call_menu", text="", icon="REMOVE").name = "MAT_MT_DeleteGroupMenu"
-        else:
-            row.operator("paint_system.new_group", icon='ADD', text="")
     
     @classmethod
     def poll(cls, context):
@@ -142,14 +151,23 @@ class MAT_PT_PaintSystemMainPanel(PSContextMixin, Panel):
     
     def draw_header(self, context):
         layout = self.layout
-        layout.label(icon_value=get_icon("sunflower"))
+        layout.label(icon_value=ICON_SUNFLOWER)
 
     def draw(self, context):
         layout = self.layout
-        layout.use_property_split = True
-        layout.use_property_decorate = False
-        legacy_ps_ctx = LegacyPaintSystemContextParser(context)
-        legacy_material_settings = legacy_ps_ctx.get_material_settings()
+        use_property_split_layout(layout)
+        ps_ctx = self.parse_context(context)
+        ps_settings = ps_ctx.ps_settings
+        ob = ps_ctx.ps_object
+        active_group = ps_ctx.active_group
+        active_channel = ps_ctx.active_channel
+        show_paint_mode_toggle = ps_settings and not ps_settings.use_legacy_ui and active_channel
+        if ob.type != 'MESH':
+            # Grease pencil only gets the paint mode toggle, skip the mesh checks below
+            if show_paint_mode_toggle:
+                toggle_paint_mode_ui(layout, context, ps_ctx)
+            return
+        legacy_material_settings = get_legacy_material_settings(context.object)
         if legacy_material_settings and legacy_material_settings.groups:
             box = layout.box()
             col = box.column()
@@ -167,19 +185,15 @@ class MAT_PT_PaintSystemMainPanel(PSContextMixin, Panel):
             row.operator("paint_system.update_paint_system_data", text="Update Paint System Data", icon="FILE_REFRESH")
             
             return
-        ps_ctx = self.parse_context(context)
-        if ps_ctx.ps_settings and not ps_ctx.ps_settings.use_legacy_ui and ps_ctx.active_channel:
-            toggle_paint_mode_ui(layout, context)
-        ob = ps_ctx.ps_object
-        if ob.type != 'MESH':
-            return
+        if show_paint_mode_toggle:
+            toggle_paint_mode_ui(layout, context, ps_ctx)
         
-        if ps_ctx.ps_settings.use_legacy_ui:
+        if ps_settings.use_legacy_ui:
             mat = ps_ctx.active_material
-            if any([ob.material_slots[i].material for i in range(len(ob.material_slots))]):
+            if any(slot.material for slot in ob.material_slots):
                 col = layout.column(align=True)
                 row = col.row(align=True)
-                scale_content(context, row, 1.5, 1.2)
+                scale_content(context, row, 1.5, 1.2, prefs=ps_settings)
                 row.menu("MAT_MT_PaintSystemMaterialSelectMenu", text="" if ob.active_material else "Empty Material", icon="MATERIAL" if ob.active_material else "MESH_CIRCLE")
                 if mat:
                     row.prop(mat, "name", text="")
@@ -189,16 +203,14 @@ class MAT_PT_PaintSystemMainPanel(PSContextMixin, Panel):
                     row.popover("MAT_PT_PaintSystemMaterialSettings", text="", icon="PREFERENCES")
         
 
-        if ps_ctx.active_group and check_group_multiuser(ps_ctx.active_group.node_tree):
-            warning_col = draw_warning_box(layout, [
-                ("Duplicated Paint System Data", 'ERROR'),
-            ])
+        if active_group and check_group_multiuser(active_group.node_tree):
+            warning_col = draw_warning_box(layout, DUPLICATED_DATA_WARNING)
             row = warning_col.row(align=True)
-            scale_content(context, row, 1.5, 1.5)
+            scale_content(context, row, 1.5, 1.5, prefs=ps_settings)
             row.operator("paint_system.duplicate_paint_system_data", text="Fix Data Duplication")
             return
 
-        if not ps_ctx.active_group:
+        if not active_group:
             row = layout.row()
             row.scale_x = 2
             row.scale_y = 2
@@ -207,34 +219,34 @@ class MAT_PT_PaintSystemMainPanel(PSContextMixin, Panel):
         # layout.label(text="Welcome to the Paint System!")
         # layout.operator("paint_system.new_image_layer", text="Create New Image Layer")
         
-        if poll_channels_panel(context):
+        if poll_channels_panel(context, ps_ctx):
             header, panel = layout.panel("MAT_PT_ChannelsPanel", default_closed=True)
-            header.label(text="Channels", icon_value=get_icon('channel'))
+            header.label(text="Channels", icon_value=ICON_CHANNEL)
             if panel:
-                draw_channels_panel(panel, context)
+                draw_channels_panel(panel, context, ps_ctx)
             else:
                 row = header.row(align=True)
                 row.scale_x = 1.1
                 row.alignment = 'RIGHT'
                 row.popover(
                     panel="MAT_PT_ChannelsSelect",
-                    text=ps_ctx.active_channel.name if ps_ctx.active_channel else "No Channel",
-                    icon_value=get_icon_from_channel(ps_ctx.active_channel)
+                    text=active_channel.name if active_channel else "No Channel",
+                    icon_value=get_icon_from_channel(active_channel)
                 )
         if poll_brush_settings(context):
             header, panel = layout.panel("MAT_PT_Brush", default_closed=True)
-            header.label(text="Brush", icon_value=get_icon('brush'))
-            if ps_ctx.ps_settings.show_tooltips:
+            header.label(text="Brush", icon_value=ICON_BRUSH)
+            if ps_settings.show_tooltips:
                 header.popover(
                     panel="MAT_PT_BrushTooltips",
                     text='',
-                    icon='INFO_LARGE' if is_newer_than(4,3) else 'INFO'
+                    icon=INFO_ICON
                 )
             if panel:
                 draw_brush_settings(panel, context)
-        if poll_brush_color_settings(context):
+        if poll_brush_color_settings(context, ps_ctx):
             header, panel = layout.panel("MAT_PT_BrushColor", default_closed=True)
-            header.label(text="Color", icon_value=get_icon('color'))
+            header.label(text="Color", icon_value=ICON_COLOR)
             if panel:
                 row = header.row(align=True)
                 row.scale_x = 1.1
@@ -244,20 +256,20 @@ class MAT_PT_PaintSystemMainPanel(PSContextMixin, Panel):
                     text="Settings",
                     icon="SETTINGS"
                 )
-                draw_brush_color_settings(panel, context)
+                draw_brush_color_settings(panel, context, ps_ctx)
             else:
                 settings = UnifiedPaintPanel.paint_settings(context)
                 brush = settings.brush
                 row = header.row(align=True)
                 row.alignment = 'RIGHT'
-                if ps_ctx.ps_object.type == 'MESH':
+                if ob.type == 'MESH':
                     split = row.split(factor=0.5, align=True)
                     split.scale_x = 1
                     split.alignment = 'RIGHT'
                     UnifiedPaintPanel.prop_unified_color(split, context, brush, "color", text="")
                     UnifiedPaintPanel.prop_unified_color(split, context, brush, "secondary_color", text="")
                     row.operator('paint.brush_colors_flip', icon='FILE_REFRESH', text="")
-                elif ps_ctx.ps_object.type == 'GREASEPENCIL':
+                elif ob.type == 'GREASEPENCIL':
                     row.prop(brush, "color", text="")
 
 class MAT_MT_DeleteGroupMenu(PSContextMixin, Menu):
@@ -282,4 +294,12 @@ classes = (
     MAT_MT_DeleteGroupMenu,
 )
 
-register, unregister = register_classes_factory(classes)
\ No newline at end of file
+_register, unregister = register_classes_factory(classes)
+
+def register():
+    global ICON_SUNFLOWER, ICON_CHANNEL, ICON_BRUSH, ICON_COLOR
+    ICON_SUNFLOWER = get_icon('sunflower')
+    ICON_CHANNEL = get_icon('channel')
+    ICON_BRUSH = get_icon('brush')
+    ICON_COLOR = get_icon('color')
+    _register()
\ No newline at end of file
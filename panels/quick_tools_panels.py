@@ -1,8 +1,7 @@
-import bpy
 from bpy.types import Panel
+from bpy.utils import register_classes_factory
 
 from .common import scale_content, PSContextMixin
-from bpy.utils import register_classes_factory
 
 
 class MAT_PT_PaintSystemQuickToolsDisplay(PSContextMixin, Panel):
@@ -11,6 +10,7 @@ class MAT_PT_PaintSystemQuickToolsDisplay(PSContextMixin, Panel):
     bl_region_type = "UI"
     bl_label = "Display"
     bl_category = 'Quick Tools'
+    bl_options = {'DEFAULT_CLOSED'}
     # bl_parent_id = 'MAT_PT_PaintSystemQuickTools'
 
     def draw_header(self, context):
@@ -20,19 +20,17 @@ class MAT_PT_PaintSystemQuickToolsDisplay(PSContextMixin, Panel):
     def draw(self, context):
         ps_ctx = self.parse_context(context)
         obj = ps_ctx.active_object
+        ps_settings = ps_ctx.ps_settings
         layout = self.layout
-        space = context.area.spaces[0]
+        space = context.space_data
 
         box = layout.box()
         if obj:
             row = box.row()
-            scale_content(context, row)
+            scale_content(context, row, prefs=ps_settings)
             row.prop(obj,
                  "show_wire", text="Toggle Wireframe", icon='MOD_WIREFRAME')
         row = box.row()
-        if not ps_ctx.ps_settings.use_compact_design:
-            row.scale_y = 1
-            row.scale_x = 1
         row.prop(space, "show_gizmo", text="Toggle Gizmo", icon='GIZMO')
         row = row.row(align=True)
         row.prop(space, "show_gizmo_object_translate",
@@ -53,23 +51,22 @@ class MAT_PT_PaintSystemQuickToolsMesh(PSContextMixin, Panel):
 
     def draw_header(self, context):
         layout = self.layout
-        ps_ctx = self.parse_context(context)
         layout.label(icon="MESH_CUBE")
 
     def draw(self, context):
         ps_ctx = self.parse_context(context)
         obj = ps_ctx.active_object
+        ps_settings = ps_ctx.ps_settings
         layout = self.layout
-        space = context.area.spaces[0]
+        space = context.space_data
         overlay = space.overlay
-        mode_string = context.mode
 
         box = layout.box()
         row = box.row()
         row.alignment = "CENTER"
         row.label(text="Add Mesh:", icon="PLUS")
         row = box.row()
-        scale_content(context, row, 1.5, 1.5)
+        scale_content(context, row, 1.5, 1.5, prefs=ps_settings)
         row.alignment = 'CENTER'
         op = row.operator("primitive_plane_add",
                      text="", icon='IMAGE_PLANE')
@@ -88,7 +85,7 @@ class MAT_PT_PaintSystemQuickToolsMesh(PSContextMixin, Panel):
         row.alignment = "CENTER"
         row.label(text="Normals:", icon="NORMALS_FACE")
         row = box.row()
-        scale_content(context, row, 1.5, 1.5)
+        scale_content(context, row, 1.5, 1.5, prefs=ps_settings)
         row.prop(overlay,
                  "show_face_orientation", text="Toggle Check Normals", icon='HIDE_OFF' if overlay.show_face_orientation else 'HIDE_ON')
         row = box.row()
@@ -101,19 +98,18 @@ class MAT_PT_PaintSystemQuickToolsMesh(PSContextMixin, Panel):
         row = box.row()
         row.alignment = "CENTER"
         row.label(text="Transforms:", icon="EMPTY_ARROWS")
-        if obj and (obj.scale[0] != 1 or obj.scale[1] != 1 or obj.scale[0] != 1):
+        if obj and tuple(obj.scale) != (1.0, 1.0, 1.0):
             box1 = box.box()
             box1.alert = True
             col = box1.column(align=True)
             col.label(text="Object is not uniform!", icon="ERROR")
             col.label(text="Apply Transform -> Scale", icon="BLANK1")
-        row = box.row()
-        scale_content(context, row, 1.5, 1.5)
-        row.menu("VIEW3D_MT_object_apply",
+        # One scaled column instead of scaling each row separately
+        col = box.column()
+        scale_content(context, col, 1.5, 1.5, prefs=ps_settings)
+        col.menu("VIEW3D_MT_object_apply",
                  text="Apply Transform", icon="LOOP_BACK")
-        row = box.row()
-        scale_content(context, row, 1.5, 1.5)
-        row.operator_menu_enum(
+        col.operator_menu_enum(
             "object.origin_set", text="Set Origin", property="type", icon="EMPTY_AXIS")
 
 
@@ -113,6 +113,37 @@ def find_node(node_tree: NodeTree, properties: dict, connected_to_output: bool =
 
     return None
 
+# Module-level cache for find_node_cached, keyed by node tree pointer:
+# {pointer: ((node count, link count), {criteria: node name or None})}
+_node_lookup_cache: dict[int, tuple[tuple[int, int], dict[tuple, str | None]]] = {}
+
+def find_node_cached(node_tree: NodeTree, properties: dict) -> Node | None:
+    """Cached find_node for UI drawing.
+
+    Results are reused until the node or link count of the tree changes, so
+    redraws skip walking the graph from the material output.
+    """
+    if not node_tree:
+        return None
+    tree_key = node_tree.as_pointer()
+    signature = (len(node_tree.nodes), len(node_tree.links))
+    cached = _node_lookup_cache.get(tree_key)
+    if cached is None or cached[0] != signature:
+        cached = (signature, {})
+        _node_lookup_cache[tree_key] = cached
+    lookups = cached[1]
+    criteria = tuple(properties.items())
+    if criteria in lookups:
+        node_name = lookups[criteria]
+        if node_name is None:
+            return None
+        node = node_tree.nodes.get(node_name)
+        if node and all(getattr(node, prop, None) == value for prop, value in criteria):
+            return node
+    node = find_node(node_tree, properties)
+    lookups[criteria] = node.name if node else None
+    return node
+
 def get_nodetree_socket_enum(node_tree: NodeTree, in_out: str = 'INPUT', favor_socket_name: str = None, include_none: bool = False, none_at_start: bool = True):
     socket_items = []
     count = 0
@@ -2,10 +2,11 @@ import bpy
 from bl_ui.properties_paint_common import (
     UnifiedPaintPanel,
 )
+from .version import HAS_TOOL_SETTINGS_UNIFIED_PAINT
 
 def get_unified_settings(context: bpy.types.Context, unified_name: str):
     tool_settings = UnifiedPaintPanel.paint_settings(context)
-    if hasattr(context.tool_settings, "unified_paint_settings"):
+    if HAS_TOOL_SETTINGS_UNIFIED_PAINT:
         ups = context.tool_settings.unified_paint_settings
     elif hasattr(tool_settings, "unified_paint_settings"):
         ups = tool_settings.unified_paint_settings
@@ -3,10 +3,18 @@ import bpy
 def is_newer_than(major, minor=0, patch=0):
     return bpy.app.version >= (major, minor, patch)
 
+# Whether this Blender build gates network use behind bpy.app.online_access.
+# Resolved once; only the online_access flag itself can change at runtime.
+HAS_ONLINE_ACCESS_GATE = is_newer_than(4, 2)
+HAS_ONLINE_ACCESS_FLAG = hasattr(bpy.app, 'online_access')
+# Whether unified paint settings live on ToolSettings rather than on each
+# paint mode's settings. Fixed for the build, so probed once at import.
+HAS_TOOL_SETTINGS_UNIFIED_PAINT = 'unified_paint_settings' in bpy.types.ToolSettings.bl_rna.properties
+
 def is_online() -> bool:
     """Check if the internet is connected."""
-    if not is_newer_than(4, 2):
+    if not HAS_ONLINE_ACCESS_GATE:
         return True
-    if not hasattr(bpy.app, 'online_access'):
+    if not HAS_ONLINE_ACCESS_FLAG:
         return False
     return bpy.app.online_access
\ No newline at end of file